@@ -8,6 +8,7 @@
 import os
 import requests
 import json
+from typing import List
 from src.utility.bronze import json_utility
 from src.utility.gold.filter_mask import FilterMask
 from src.configuration import configuration as cfg
@@ -21,4 +22,14 @@ if __name__ == "__main__":
     #    os.remove(DEFAULT_DB_PATH)
     db = ModelDatabase(database_uri=None, schema="civitai", verbose=True)
     wrapper = CivitaiAPIWrapper()
-    # handler.scrape_available_models(wrapper.get_source_name())
+
+    def callback(model_entries: List[dict]) -> None:
+        """
+        Callback for adding a batch of scraped model entries.
+        :param model_entries: Model entries.
+        """
+        db.put_objects("model", ["url"], [wrapper.normalize_metadata(
+            "model", model_entry) for model_entry in model_entries])
+
+    for model_entries in wrapper.iter_model_batches():
+        callback(model_entries)
@@ -9,6 +9,7 @@ import unittest
 from src.quality.configuration_tests import test_configuration
 from src.quality.model_tests import test_dataclasses
 from src.quality.model_tests import test_llm_pool
+from src.quality.model_tests import test_api_wrapper
 from src.quality.control_tests import test_backend_controller
 
 loader = unittest.TestLoader()
@@ -16,6 +17,7 @@ suite = unittest.TestSuite()
 suite.addTests(loader.loadTestsFromModule(test_configuration))
 suite.addTests(loader.loadTestsFromModule(test_dataclasses))
 suite.addTests(loader.loadTestsFromModule(test_llm_pool))
+suite.addTests(loader.loadTestsFromModule(test_api_wrapper))
 suite.addTests(loader.loadTestsFromModule(test_backend_controller))
 
 
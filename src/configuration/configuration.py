@@ -7,7 +7,8 @@
 """
 import os
 import logging
-from dotenv import dotenv_values
+from functools import cache
+from dotenv import load_dotenv
 from . import paths as PATHS
 from . import urls as URLS
 
@@ -15,7 +16,8 @@ from . import urls as URLS
 """
 Environment file
 """
-ENV = dotenv_values(os.path.join(PATHS.PACKAGE_PATH, ".env"))
+load_dotenv(os.path.join(PATHS.PACKAGE_PATH, ".env"), override=False)
+ENV = os.environ
 
 
 """
@@ -23,47 +25,33 @@ Logger
 """
 
 
-class LOGGER_REPLACEMENT(object):
-    """
-    Temporary logger replacement class.
-    """
+logging.basicConfig(level=ENV.get("LOG_LEVEL", "INFO").upper(),
+                    format="[%(levelname)s] %(message)s")
+LOGGER = logging.getLogger("blmb")
 
-    def debug(self, text: str) -> None:
-        """
-        Method replacement for logging.
-        :param text: Text to log.
-        """
-        print(f"[DEBUG] {text}")
 
-    def info(self, text: str) -> None:
-        """
-        Method replacement for logging.
-        :param text: Text to log.
-        """
-        print(f"[INFO] {text}")
+"""
+Backends
+"""
 
-    def warning(self, text: str) -> None:
-        """
-        Method replacement for logging.
-        :param text: Text to log.
-        """
-        print(f"[WARNING] {text}")
 
-    def warn(self, text: str) -> None:
-        """
-        Method replacement for logging.
-        :param text: Text to log.
-        """
-        print(f"[WARNING] {text}")
+@cache
+def get_backend_host() -> str:
+    """
+    Function for getting the backend host.
+    :return: Backend host.
+    """
+    return ENV.get("BACKEND_HOST", "127.0.0.1")
 
 
-LOGGER = LOGGER_REPLACEMENT()
-# LOGGER = logging.Logger("LMBACKEND")
-# LOGGER.setLevel(level=logging.INFO)
+@cache
+def get_backend_port() -> str:
+    """
+    Function for getting the backend port.
+    :return: Backend port.
+    """
+    return ENV.get("BACKEND_PORT", "7861")
 
 
-"""
-Backends
-"""
-BACKEND_HOST = ENV.get("BACKEND_HOST", "127.0.0.1")
-BACKEND_PORT = ENV.get("BACKEND_PORT", "7861")
+BACKEND_HOST = get_backend_host()
+BACKEND_PORT = get_backend_port()
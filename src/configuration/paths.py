@@ -43,3 +43,5 @@ MODEL_CONTROL_FRONTEND_CACHE = os.path.join(
     BACKEND_PATH, "model_control", "frontend_cache.json")
 MODEL_CONTROL_FRONTEND_ASSETS = os.path.join(
     BACKEND_PATH, "model_control", "assets")
+MODEL_CONTROL_API_CACHE = os.path.join(
+    BACKEND_PATH, "model_control", "api_cache")
@@ -7,11 +7,11 @@
 """
 import os
 from time import sleep
-from datetime import datetime as dt
+from datetime import datetime as dt, timedelta
 from typing import Optional, Any, List, Dict, Union
 from src.configuration import configuration as cfg
 from src.utility.gold.basic_sqlalchemy_interface import BasicSQLAlchemyInterface
-from src.utility.bronze import sqlalchemy_utility
+from src.utility.bronze import sqlalchemy_utility, json_utility
 from src.utility.bronze.hashing_utility import hash_text_with_sha256
 from src.model.backend_control.data_model import populate_data_instrastructure
 from src.model.backend_control.llm_pool import ThreadedLLMPool
@@ -43,7 +43,9 @@ class BackendController(BasicSQLAlchemyInterface):
 
         # Database infrastructure
         super().__init__(self.working_directory, self.database_uri,
-                         populate_data_instrastructure, "backend_control.", self._logger)
+                         populate_data_instrastructure, "backend_control.", self._logger,
+                         engine_kwargs={"json_serializer": json_utility.serialize,
+                                        "json_deserializer": json_utility.deserialize})
         self.base = None
         self.engine = None
         self.model = None
@@ -84,10 +86,39 @@ class BackendController(BasicSQLAlchemyInterface):
         """
         Method for running shutdown process.
         """
-        self.llm_pool.stop_all()
+        self.llm_pool.close()
         while any(self.llm_pool.is_running(instance_id) for instance_id in self._cache):
             sleep(2.0)
 
+    """
+    Log handling methods
+    """
+
+    def archive_logs(self, older_than_days: int, chunk_size: int = 10_000) -> int:
+        """
+        Method for rotating the log table by deleting outdated log entries.
+        Entries are deleted in chunks to keep single transactions small.
+        The IDs of a chunk are selected before deleting them, as not all dialects support limits in subqueries.
+        :param older_than_days: Age in days, after which log entries are deleted.
+        :param chunk_size: Number of log entries to delete per transaction.
+            Defaults to 10000.
+        :return: Number of deleted log entries.
+        """
+        log = self.model["log"]
+        cutoff = dt.now() - timedelta(days=older_than_days)
+        deleted = 0
+        while True:
+            with self.engine.begin() as connection:
+                outdated_ids = connection.execute(sqlalchemy_utility.select(log.id).where(
+                    log.requested < cutoff).limit(chunk_size)).scalars().all()
+                if outdated_ids:
+                    connection.execute(sqlalchemy_utility.delete(
+                        log).where(log.id.in_(outdated_ids)))
+            deleted += len(outdated_ids)
+            if len(outdated_ids) < chunk_size:
+                break
+        return deleted
+
     """
     LLM handling methods
     """
@@ -84,7 +84,7 @@ class KnowledgebaseController(BasicSQLAlchemyInterface):
         """
         Method for running shutdown process.
         """
-        self.llm_pool.stop_all()
+        self.llm_pool.close()
         while any(self.llm_pool.is_running(instance_id) for instance_id in self._cache):
             sleep(2.0)
 
@@ -6,9 +6,12 @@
 ****************************************************
 """
 import uvicorn
+import asyncio
+import logging
 from enum import Enum
 from typing import Optional, Any
-from datetime import datetime as dt
+from time import perf_counter_ns
+from datetime import datetime as dt, timedelta
 from fastapi import FastAPI, File, UploadFile
 from pydantic import BaseModel
 from functools import wraps
@@ -21,6 +24,9 @@ Backend control
 BACKEND = FastAPI(title="LLM Tutor Backend", version="0.1",
                   description="Backend for serving LLM Tutor services.")
 CONTROLLER: BackendController = BackendController()
+LOG_QUEUE: asyncio.Queue = asyncio.Queue()
+LOG_BATCH_SIZE = 100
+LOG_INTERVAL = 1.0
 
 
 def interface_function() -> Optional[Any]:
@@ -37,6 +43,12 @@ def interface_function() -> Optional[Any]:
         :param func: Wrapped function.
         :return: Error message if status is incorrect, else function return.
         """
+        # Bind hot path lookups to closure variables
+        function_name = func.__name__
+        dt_now = dt.now
+        logging_info = logging.info
+        put_log_entry = LOG_QUEUE.put_nowait
+
         @wraps(func)
         async def inner(*args: Optional[Any], **kwargs: Optional[Any]):
             """
@@ -44,25 +56,106 @@ def interface_function() -> Optional[Any]:
             :param args: Arguments.
             :param kwargs: Keyword arguments.
             """
-            requested = dt.now()
+            requested = dt_now()
+            start = perf_counter_ns()
             response = await func(*args, **kwargs)
-            responded = dt.now()
-            CONTROLLER.post_object(
-                "log",
-                request={
-                    "function": func.__name__,
+            log_data = {
+                "request": {
+                    "function": function_name,
                     "args": args,
                     "kwargs": kwargs
                 },
-                response=response,
-                requested=requested,
-                responded=responded
-            )
+                "response": response,
+                "requested": requested,
+                "responded": requested + timedelta(microseconds=(perf_counter_ns() - start) // 1000)
+            }
+            logging_info("Backend interaction: %s", log_data)
+            put_log_entry(log_data)
             return response
         return inner
     return wrapper
 
 
+def write_log_batch(batch: list) -> None:
+    """
+    Function for writing a batch of log entries to the database.
+    Failures are logged instead of raised, so that a single failing batch does not stop log writing.
+    :param batch: Log entries.
+    """
+    global CONTROLLER
+    if batch:
+        try:
+            CONTROLLER.post_objects("log", batch)
+        except Exception as ex:
+            cfg.LOGGER.warning(
+                "Writing %s log entries failed: %s", len(batch), ex)
+
+
+async def write_log_entries() -> None:
+    """
+    Function for writing queued log entries to the database.
+    Entries are collected up to the batch size or for the logging interval and written in bulk.
+    On cancellation, entries which were already collected are written before the cancellation is propagated.
+    """
+    loop = asyncio.get_running_loop()
+    while True:
+        batch = []
+        try:
+            batch.append(await LOG_QUEUE.get())
+            deadline = loop.time() + LOG_INTERVAL
+            while len(batch) < LOG_BATCH_SIZE:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(LOG_QUEUE.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+        except asyncio.CancelledError:
+            write_log_batch(batch)
+            raise
+        # A cancelled write still finishes in its thread, so the batch is not written again
+        await asyncio.to_thread(write_log_batch, batch)
+
+
+def flush_log_entries() -> None:
+    """
+    Function for writing all remaining queued log entries to the database.
+    """
+    batch = []
+    while not LOG_QUEUE.empty():
+        batch.append(LOG_QUEUE.get_nowait())
+    write_log_batch(batch)
+
+
+@BACKEND.on_event("startup")
+async def start_log_writer() -> None:
+    """
+    Function for starting the log writer on backend startup.
+    If the environment variable "LOG_RETENTION_DAYS" is set, outdated log entries are removed beforehand.
+    """
+    global CONTROLLER
+    if cfg.ENV.get("LOG_RETENTION_DAYS") is not None:
+        await asyncio.to_thread(CONTROLLER.archive_logs, int(cfg.ENV["LOG_RETENTION_DAYS"]))
+    BACKEND.state.log_writer = asyncio.create_task(write_log_entries())
+
+
+@BACKEND.on_event("shutdown")
+async def stop_log_writer() -> None:
+    """
+    Function for stopping the log writer on backend shutdown.
+    The log writer might be missing, if the startup failed before it was started.
+    """
+    log_writer = getattr(BACKEND.state, "log_writer", None)
+    if log_writer is not None:
+        log_writer.cancel()
+        try:
+            await log_writer
+        except asyncio.CancelledError:
+            pass
+    flush_log_entries()
+
+
 """
 Dataclasses
 """
@@ -71,24 +164,25 @@ Dataclasses
 """
 BACKEND ENDPOINTS
 """
+BASE_PATH = "/api/v1"
 
 
 class Endpoints(str, Enum):
     """
     String-based endpoint enum class.
     """
-    BASE = "/api/v1"
+    BASE = BASE_PATH
 
-    GET_LLMS = f"{BASE}/llms/"
-    GET_KBS = f"{BASE}/kbs/"
+    GET_LLMS = f"{BASE_PATH}/llms/"
+    GET_KBS = f"{BASE_PATH}/kbs/"
 
-    CREATE_KB = f"{BASE}/kbs/create"
-    DELETE_KB = f"{BASE}/kbs/delete/{{kb_id}}"
+    CREATE_KB = f"{BASE_PATH}/kbs/create"
+    DELETE_KB = f"{BASE_PATH}/kbs/delete/{{kb_id}}"
 
-    UPLOAD_DOCUMENT = f"{BASE}/kbs/upload/{{kb_id}}"
-    DELETE_DOCUMENT = f"{BASE}/kbs/delete_doc/{{doc_id}}"
+    UPLOAD_DOCUMENT = f"{BASE_PATH}/kbs/upload/{{kb_id}}"
+    DELETE_DOCUMENT = f"{BASE_PATH}/kbs/delete_doc/{{doc_id}}"
 
-    POST_QUERY = f"{BASE}/query"
+    POST_QUERY = f"{BASE_PATH}/query"
 
     def __str__(self) -> str:
         """
@@ -102,7 +196,7 @@ Endpoints
 """
 
 
-@BACKEND.get(Endpoints.GET_LLMS)
+@BACKEND.get(Endpoints.GET_LLMS.value)
 @interface_function()
 async def get_llms() -> dict:
     """
@@ -113,7 +207,7 @@ async def get_llms() -> dict:
     return {"llms": CONTROLLER.get_objects_by_type("modelinstance")}
 
 
-@BACKEND.get(Endpoints.GET_KBS)
+@BACKEND.get(Endpoints.GET_KBS.value)
 @interface_function()
 async def get_kbs() -> dict:
     """
@@ -124,7 +218,7 @@ async def get_kbs() -> dict:
     return {"kbs": CONTROLLER.get_objects_by_type("knowledgebase")}
 
 
-@BACKEND.post(Endpoints.CREATE_KB)
+@BACKEND.post(Endpoints.CREATE_KB.value)
 @interface_function()
 async def post_kb(uuid: str) -> str:
     """
@@ -138,7 +232,7 @@ async def post_kb(uuid: str) -> str:
     return {"kb_id": kb_id}
 
 
-@BACKEND.delete(Endpoints.DELETE_KB)
+@BACKEND.delete(Endpoints.DELETE_KB.value)
 @interface_function()
 async def delete_kb(kb_id: int) -> dict:
     """
@@ -152,7 +246,7 @@ async def delete_kb(kb_id: int) -> dict:
     return {"kb_id": kb_id}
 
 
-@BACKEND.post(Endpoints.UPLOAD_DOCUMENT)
+@BACKEND.post(Endpoints.UPLOAD_DOCUMENT.value)
 @interface_function()
 async def upload_document(kb_id: int, document_content: str, document_metadata: dict = None) -> dict:
     """
@@ -168,7 +262,7 @@ async def upload_document(kb_id: int, document_content: str, document_metadata:
     return {"document_id": document_id}
 
 
-@BACKEND.delete(Endpoints.DELETE_DOCUMENT)
+@BACKEND.delete(Endpoints.DELETE_DOCUMENT.value)
 @interface_function()
 async def delete_document(document_id: int) -> dict:
     """
@@ -181,7 +275,7 @@ async def delete_document(document_id: int) -> dict:
     return {"document_id": document_id}
 
 
-@BACKEND.post(Endpoints.POST_QUERY)
+@BACKEND.post(Endpoints.POST_QUERY.value)
 @interface_function()
 async def post_qa_query(llm_id: int, kb_id: int, query: str, include_sources: bool = True) -> dict:
     """
@@ -202,18 +296,28 @@ Backend runner
 """
 
 
-def run_backend(host: str = None, port: int = None, reload: bool = True) -> None:
+def run_backend(host: str = None, port: int = None, reload: bool = None, workers: int = None) -> None:
     """
     Function for running backend server.
     :param host: Server host. Defaults to None in which case "127.0.0.1" is set.
     :param port: Server port. Defaults to None in which case either environment variable "BACKEND_PORT" is set or 7861.
-    :param reload: Reload flag for server. Defaults to True.
+    :param reload: Reload flag for server. Defaults to None in which case reloading is active, if environment variable "DEV" is set.
+    :param workers: Number of worker processes. Defaults to None in which case either environment variable "BACKEND_WORKERS" is set or 1.
+        Note, that every worker process loads its own controller and language model instances.
+        Ignored, if reloading is active.
     """
+    reload = cfg.ENV.get("DEV", "").lower() in [
+        "1", "true", "yes"] if reload is None else reload
+    workers = int(cfg.ENV.get("BACKEND_WORKERS", 1)
+                  if workers is None else workers)
     uvicorn.run("src.interfaces.backend_interface:BACKEND",
                 host="127.0.0.1" if host is None else host,
                 port=int(
-                    cfg.ENV.get("BACKEND_PORT", 7861) if port is None else port),
-                reload=False)
+                    cfg.get_backend_port() if port is None else port),
+                reload=reload,
+                workers=None if reload else workers,
+                loop="uvloop",
+                http="httptools")
 
 
 if __name__ == "__main__":
@@ -6,32 +6,274 @@
 ****************************************************
 """
 import sys
-from typing import Optional, Any
+import struct
+import selectors
+from typing import Optional, Any, Union, Tuple, Callable, Dict
+from time import monotonic
 from abc import ABC, abstractmethod
 from uuid import uuid4
-from queue import Empty, Queue as TQueue
-from multiprocessing import Process, Queue as MPQueue, Event as mp_get_event
+from queue import Empty, Full, Queue as TQueue, SimpleQueue
+from multiprocessing import Queue as MPQueue, get_context
+from multiprocessing.shared_memory import SharedMemory
 from multiprocessing.synchronize import Event as MPEvent
-from threading import Thread, Event as TEvent
+from threading import Thread, Condition, Lock, Event as TEvent
+from collections import deque
 from src.utility.gold.transformer_model_utility import spawn_language_model_instance
 from src.utility.bronze import dictionary_utility
 
 
-def run_threaded_llm(switch: TEvent, llm_configuraiton: dict, input_queue: TQueue, output_queue: TQueue) -> None:
+# Number of batches worth of pending requests, which are collected into a window for sorting by prompt length
+BUCKETING_WINDOW = 4
+# Size of shared memory ring buffers for prompt transport in bytes
+RING_BUFFER_SIZE = 1 << 20
+# Record header, containing the byte lengths of request ID and prompt
+RING_BUFFER_HEADER = struct.Struct("<II")
+# Modules, which are imported once by the fork server, so that worker processes start with them preloaded
+PRELOADED_MODULES = ["src.utility.gold.transformer_model_utility"]
+# Multiprocessing context for forking worker processes from the fork server
+# The preload configuration is process-wide and only takes effect before the fork server is started
+FORKSERVER_CONTEXT = get_context("forkserver")
+FORKSERVER_CONTEXT.set_forkserver_preload(PRELOADED_MODULES)
+
+
+class SharedMemoryRingBuffer(object):
+    """
+    Class, representing a shared memory ring buffer for transporting prompts to worker processes.
+    Records are written as length-prefixed UTF-8 encoded request IDs and prompts, avoiding pickling and pipe transfers.
+    The buffer offers the queue methods, used by the request serving loop.
+    """
+
+    def __init__(self, size: int = RING_BUFFER_SIZE, context: Any = None) -> None:
+        """
+        Initiation method.
+        :param size: Buffer size in bytes.
+            Defaults to RING_BUFFER_SIZE.
+        :param context: Multiprocessing context for creating synchronization primitives.
+            Defaults to None in which case the default context is used.
+        """
+        context = get_context() if context is None else context
+        self.size = size
+        self.memory = SharedMemory(create=True, size=size)
+        self.head = context.Value("Q", 0, lock=False)
+        self.tail = context.Value("Q", 0, lock=False)
+        self.condition = context.Condition()
+        self.closed = False
+
+    def _write(self, position: int, data: bytes) -> None:
+        """
+        Internal method for writing data to the buffer, wrapping around at its end.
+        :param position: Absolute write position.
+        :param data: Data to write.
+        """
+        offset = position % self.size
+        first_part = min(len(data), self.size - offset)
+        self.memory.buf[offset:offset+first_part] = data[:first_part]
+        self.memory.buf[:len(data)-first_part] = data[first_part:]
+
+    def _read(self, position: int, length: int) -> bytes:
+        """
+        Internal method for reading data from the buffer, wrapping around at its end.
+        :param position: Absolute read position.
+        :param length: Number of bytes to read.
+        :return: Read data.
+        """
+        offset = position % self.size
+        first_part = min(length, self.size - offset)
+        return bytes(self.memory.buf[offset:offset+first_part]) + bytes(self.memory.buf[:length-first_part])
+
+    def put(self, item: Tuple[str, str], timeout: float = None) -> None:
+        """
+        Method for putting a request into the buffer.
+        Blocks until sufficient space is available.
+        :param item: Tuple of request ID and prompt.
+        :param timeout: Timeout for waiting on sufficient space.
+            Defaults to None in which case the method blocks until sufficient space is available.
+        :raises Full: If not sufficient space is available before the timeout is passed.
+        :raises ValueError: If the buffer is closed or the request exceeds the buffer size.
+        """
+        if self.closed:
+            raise ValueError("Ring buffer is closed.")
+        request_id, prompt = (part.encode("utf-8") for part in item)
+        record = RING_BUFFER_HEADER.pack(
+            len(request_id), len(prompt)) + request_id + prompt
+        if len(record) > self.size:
+            raise ValueError(
+                f"Request of {len(record)} bytes exceeds ring buffer size of {self.size} bytes.")
+        with self.condition:
+            if not self.condition.wait_for(lambda: self.size - (self.head.value -
+                                           self.tail.value) >= len(record), timeout):
+                raise Full
+            self._write(self.head.value, record)
+            self.head.value += len(record)
+            self.condition.notify_all()
+
+    def get(self, timeout: float = None) -> Tuple[str, str]:
+        """
+        Method for getting a request from the buffer.
+        :param timeout: Timeout for waiting on a request.
+            Defaults to None in which case the method blocks until a request is available.
+        :return: Tuple of request ID and prompt.
+        :raises Empty: If no request is available before the timeout is passed.
+        """
+        with self.condition:
+            if not self.condition.wait_for(lambda: self.head.value != self.tail.value, timeout):
+                raise Empty
+            position = self.tail.value
+            id_length, prompt_length = RING_BUFFER_HEADER.unpack(
+                self._read(position, RING_BUFFER_HEADER.size))
+            position += RING_BUFFER_HEADER.size
+            request_id = self._read(position, id_length).decode("utf-8")
+            prompt = self._read(
+                position + id_length, prompt_length).decode("utf-8")
+            self.tail.value = position + id_length + prompt_length
+            self.condition.notify_all()
+        return request_id, prompt
+
+    def get_nowait(self) -> Tuple[str, str]:
+        """
+        Method for getting a request from the buffer without waiting.
+        :return: Tuple of request ID and prompt.
+        :raises Empty: If no request is available.
+        """
+        return self.get(timeout=0)
+
+    def close(self) -> None:
+        """
+        Method for closing and releasing the shared memory.
+        """
+        if not self.closed:
+            self.closed = True
+            self.memory.close()
+            self.memory.unlink()
+
+
+class EventDeque(object):
+    """
+    Class, representing a lightweight request buffer for worker threads.
+    Producers append to a deque and set an event, the consumer only waits on the event while the deque is empty.
+    In contrast to a queue, no condition variable is notified per item and pending items are drained without waiting.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initiation method.
+        """
+        self.buffer = deque()
+        self.event = TEvent()
+        self.lock = Lock()
+
+    def put(self, item: Any, timeout: float = None) -> None:
+        """
+        Method for putting an item into the buffer.
+        The buffer is unbounded, so putting never blocks.
+        :param item: Item to put.
+        :param timeout: Unused timeout, kept for interface compatibility.
+        """
+        with self.lock:
+            self.buffer.append(item)
+            self.event.set()
+
+    def get(self, timeout: float = None) -> Any:
+        """
+        Method for getting an item from the buffer.
+        :param timeout: Timeout for waiting on an item.
+            Defaults to None in which case the method blocks until an item is available.
+        :return: Item.
+        :raises Empty: If no item is available before the timeout is passed.
+        """
+        deadline = None if timeout is None else monotonic() + timeout
+        while True:
+            with self.lock:
+                if self.buffer:
+                    return self.buffer.popleft()
+                self.event.clear()
+            remaining = None if deadline is None else deadline - monotonic()
+            if (remaining is not None and remaining <= 0) or not self.event.wait(remaining):
+                raise Empty
+
+    def get_nowait(self) -> Any:
+        """
+        Method for getting an item from the buffer without waiting.
+        :return: Item.
+        :raises Empty: If no item is available.
+        """
+        with self.lock:
+            if self.buffer:
+                return self.buffer.popleft()
+        raise Empty
+
+
+def serve_requests(llm: Any, switch: Union[TEvent, MPEvent], input_queue: Union[EventDeque, SharedMemoryRingBuffer], output_queue: Union[TQueue, MPQueue], max_batch_size: int) -> None:
+    """
+    Function for serving generation requests until the killswitch is set.
+    Requests are given as tuples of request ID and prompt. Pending requests are collected in windows of up to
+    BUCKETING_WINDOW batches in arrival order. Each window is sorted by decreasing prompt length and handed over to the
+    LLM instance in batches of similar length, bounding the padding overhead. A window is fully served before the
+    next one is collected, so every request is served within BUCKETING_WINDOW batches.
+    Responses are put into the output queue as tuples of request ID and response.
+    :param llm: LLM instance.
+    :param switch: Pool killswitch event.
+    :param input_queue: Input queue.
+    :param output_queue: Output queue.
+    :param max_batch_size: Maximum number of prompts to generate responses for at once.
+    """
+    batches = deque()
+    while not switch.is_set():
+        if not batches:
+            try:
+                window = [input_queue.get(timeout=0.5)]
+            except Empty:
+                continue
+            while len(window) < BUCKETING_WINDOW * max_batch_size:
+                try:
+                    window.append(input_queue.get_nowait())
+                except Empty:
+                    break
+            window.sort(key=lambda request: len(request[1]), reverse=True)
+            batches.extend(window[index:index+max_batch_size]
+                           for index in range(0, len(window), max_batch_size))
+        requests = batches.popleft()
+        responses = llm.generate([prompt for _, prompt in requests])
+        for (request_id, _), response in zip(requests, responses):
+            output_queue.put((request_id, response))
+
+
+def dispatch_requests(request_queue: SimpleQueue, workers: dict) -> None:
+    """
+    Function for dispatching requests from a shared request queue to the input buffers of their target workers.
+    Requests are given as tuples of worker UUID, request ID and prompt. A None value stops the dispatching.
+    Requests for workers without input buffer are dropped and run into the generation timeout.
+    :param request_queue: Shared request queue.
+    :param workers: Worker dictionary.
+    """
+    while (request := request_queue.get()) is not None:
+        worker_uuid, request_id, prompt = request
+        input_buffer = workers.get(worker_uuid, {}).get("input")
+        if input_buffer is not None:
+            input_buffer.put((request_id, prompt))
+
+
+def run_threaded_llm(switch: TEvent, llm_configuraiton: dict, input_queue: EventDeque, output_queue: TQueue, max_batch_size: int = 16) -> None:
     """
     Function for running LLM instance in threading mode.
+    The LLM instance is unloaded after serving, as instances might share their model with other worker threads.
     :param switch: Pool killswitch event.
     :param llm_configuration: Configuration to instantiate LLM.
             Dictionary containing "model_path" and "model_config".
     :param input_queue: Input queue.
     :param output_queue: Output queue.
+    :param max_batch_size: Maximum number of prompts to generate responses for at once.
+        Defaults to 16.
     """
     llm = spawn_language_model_instance(**llm_configuraiton)
-    while not switch.wait(0.5):
-        output_queue.put(llm.generate(input_queue.get()))
+    try:
+        serve_requests(llm, switch, input_queue, output_queue, max_batch_size)
+    finally:
+        if hasattr(llm, "unload"):
+            llm.unload()
 
 
-def run_multiprocessed_llm(switch: MPEvent, llm_configuraiton: dict, input_queue: MPQueue, output_queue: MPQueue) -> None:
+def run_multiprocessed_llm(switch: MPEvent, llm_configuraiton: dict, input_queue: SharedMemoryRingBuffer, output_queue: MPQueue, max_batch_size: int = 16, spawning_function: Callable = None) -> None:
     """
     Function for running LLM instance in multiprocessing mode.
     :param switch: Pool killswitch event.
@@ -39,11 +281,15 @@ def run_multiprocessed_llm(switch: MPEvent, llm_configuraiton: dict, input_queue
             Dictionary containing "model_path" and "model_config".
     :param input_queue: Input queue.
     :param output_queue: Output queue.
+    :param max_batch_size: Maximum number of prompts to generate responses for at once.
+        Defaults to 16.
+    :param spawning_function: Function for spawning the LLM instance.
+        Defaults to None in which case the default language model spawning function is used.
     """
     try:
-        llm = spawn_language_model_instance(**llm_configuraiton)
-        while not switch.wait(0.5):
-            output_queue.put(llm.generate(input_queue.get()))
+        spawning_function = spawn_language_model_instance if spawning_function is None else spawning_function
+        llm = spawning_function(**llm_configuraiton)
+        serve_requests(llm, switch, input_queue, output_queue, max_batch_size)
     except:
         sys.exit(1)
     sys.exit(0)
@@ -54,7 +300,7 @@ class LLMPool(ABC):
     Class for handling a pool of LLM instances.
     """
 
-    def __init__(self, queue_spawns: bool = False, generation_timeout: float = None) -> None:
+    def __init__(self, queue_spawns: bool = False, generation_timeout: float = None, max_batch_size: int = 16) -> None:
         """
         Initiation method.
         :param queue_spawns: Queue up instanciation until resources are available.
@@ -62,19 +308,44 @@ class LLMPool(ABC):
         :param generation_timeout: Timeout for generation tasks.
             Defaults to None in which case the generation task potentially runs indefinitly.
             If set, a None value will be returned if the timeout value is passed.
+        :param max_batch_size: Maximum number of pending prompts, a worker generates responses for at once.
+            Defaults to 16.
         """
         # TODO: Add prioritization and potentially interrupt concept
         self.queue_spawns = queue_spawns
         self.generation_timeout = generation_timeout
+        self.max_batch_size = max_batch_size
         self.workers = {}
 
+    @property
+    def worker_count(self) -> int:
+        """
+        Property for the number of prepared workers.
+        :return: Worker count.
+        """
+        return len(self.workers)
+
+    def first_worker(self) -> Optional[str]:
+        """
+        Method for getting the first prepared worker without copying the worker keys.
+        :return: Worker UUID, if a worker was prepared, else None.
+        """
+        return next(iter(self.workers), None)
+
     def stop_all(self) -> None:
         """
         Method for stopping workers.
         """
         for worker_uuid in self.workers:
-            self._unload_llm(worker_uuid)
-            self.workers[worker_uuid]["running"] = False
+            if self.workers[worker_uuid]["running"]:
+                self._unload_llm(worker_uuid)
+                self.workers[worker_uuid]["running"] = False
+
+    def close(self) -> None:
+        """
+        Method for stopping workers and releasing pool resources.
+        """
+        self.stop_all()
 
     def stop(self, target_worker: str) -> None:
         """
@@ -140,7 +411,10 @@ class LLMPool(ABC):
         if uuid not in self.workers:
             self.workers[uuid] = {
                 "config": llm_configuration,
-                "running": False
+                "running": False,
+                "responses": {},
+                "condition": Condition(),
+                "reading": False
             }
         else:
             self.reset_llm(uuid, llm_configuration)
@@ -162,7 +436,6 @@ class LLMPool(ABC):
         """
         pass
 
-    @abstractmethod
     def generate(self, target_worker: str, prompt: str) -> Optional[Any]:
         """
         Request generation response for query from target LLM.
@@ -170,21 +443,118 @@ class LLMPool(ABC):
         :param prompt: Prompt to send.
         :return: Response.
         """
-        pass
+        request_id = uuid4().hex
+        worker = self.workers[target_worker]
+        with worker["condition"]:
+            worker["responses"][request_id] = None
+        if not self._submit_request(target_worker, request_id, prompt):
+            with worker["condition"]:
+                worker["responses"].pop(request_id, None)
+            return None
+        return self._await_response(target_worker, request_id)
+
+    def _submit_request(self, target_worker: str, request_id: str, prompt: str) -> bool:
+        """
+        Internal method for submitting a request to a worker.
+        :param target_worker: Target worker.
+        :param request_id: Request ID.
+        :param prompt: Prompt to send.
+        :return: True, if the request was submitted, False if the worker input is closed or full
+            until the generation timeout is passed.
+        """
+        try:
+            self.workers[target_worker]["input"].put(
+                (request_id, prompt), timeout=self.generation_timeout)
+            return True
+        except (Full, ValueError):
+            return False
+
+    def _await_response(self, target_worker: str, request_id: str) -> Optional[Any]:
+        """
+        Internal method for awaiting the response to a request.
+        Only one caller at a time reads from the output queue of a worker and hands over responses to other callers.
+        :param target_worker: Target worker.
+        :param request_id: Request ID.
+        :return: Response or None, if the generation timeout is passed.
+        """
+        worker = self.workers[target_worker]
+        deadline = None if self.generation_timeout is None else monotonic() + \
+            self.generation_timeout
+        with worker["condition"]:
+            while worker["responses"].get(request_id) is None:
+                timeout = None if deadline is None else deadline - monotonic()
+                if timeout is not None and timeout <= 0:
+                    worker["responses"].pop(request_id, None)
+                    return None
+                if worker["reading"]:
+                    worker["condition"].wait(timeout)
+                    continue
+                worker["reading"] = True
+                worker["condition"].release()
+                try:
+                    response_id, response = worker["output"].get(
+                        timeout=timeout)
+                except Empty:
+                    response_id = None
+                finally:
+                    worker["condition"].acquire()
+                    worker["reading"] = False
+                if response_id in worker["responses"]:
+                    worker["responses"][response_id] = (response,)
+                worker["condition"].notify_all()
+            return worker["responses"].pop(request_id)[0]
 
 
 class ThreadedLLMPool(LLMPool):
     """
     Class for handling a pool of LLM instances in separated threads for leightweight non-blocking I/O.
+    Requests are submitted to a single shared queue and dispatched to the worker input buffers by a dispatcher thread.
     """
 
+    def __init__(self, queue_spawns: bool = False, generation_timeout: float = None, max_batch_size: int = 16) -> None:
+        """
+        Initiation method.
+        :param queue_spawns: Queue up instanciation until resources are available.
+            Defaults to False.
+        :param generation_timeout: Timeout for generation tasks.
+            Defaults to None in which case the generation task potentially runs indefinitly.
+            If set, a None value will be returned if the timeout value is passed.
+        :param max_batch_size: Maximum number of pending prompts, a worker generates responses for at once.
+            Defaults to 16.
+        """
+        super().__init__(queue_spawns, generation_timeout, max_batch_size)
+        self.request_queue = SimpleQueue()
+        self.dispatcher = Thread(target=dispatch_requests, args=(
+            self.request_queue, self.workers), daemon=True)
+        self.dispatcher.start()
+
+    def _submit_request(self, target_worker: str, request_id: str, prompt: str) -> bool:
+        """
+        Internal method for submitting a request to a worker.
+        :param target_worker: Target worker.
+        :param request_id: Request ID.
+        :param prompt: Prompt to send.
+        :return: True, as the shared request queue is unbounded.
+        """
+        self.request_queue.put((target_worker, request_id, prompt))
+        return True
+
+    def close(self) -> None:
+        """
+        Method for stopping workers and the request dispatcher.
+        """
+        super().close()
+        if self.dispatcher.is_alive():
+            self.request_queue.put(None)
+            self.dispatcher.join()
+
     def _load_llm(self, target_worker: str) -> None:
         """
         Internal method for loading LLM.
         :param target_worker: Worker to start.
         """
         self.workers[target_worker]["switch"] = TEvent()
-        self.workers[target_worker]["input"] = TQueue()
+        self.workers[target_worker]["input"] = EventDeque()
         self.workers[target_worker]["output"] = TQueue()
         self.workers[target_worker]["worker"] = Thread(
             target=run_threaded_llm,
@@ -193,6 +563,7 @@ class ThreadedLLMPool(LLMPool):
                 self.workers[target_worker]["config"],
                 self.workers[target_worker]["input"],
                 self.workers[target_worker]["output"],
+                self.max_batch_size
             )
         )
         self.workers[target_worker]["worker"].daemon = True
@@ -207,43 +578,121 @@ class ThreadedLLMPool(LLMPool):
         self.workers[target_worker]["switch"].set()
         self.workers[target_worker]["worker"].join(1)
 
-    def generate(self, target_worker: str, prompt: str) -> Optional[Any]:
-        """
-        Request generation response for query from target LLM.
-        :param target_worker: Target worker.
-        :param prompt: Prompt to send.
-        :return: Response.
-        """
-        self.workers[target_worker]["input"].put(prompt)
-        try:
-            return self.workers[target_worker]["output"].get(timeout=self.generation_timeout)
-        except Empty:
-            return None
-
 
 class MulitprocessingLLMPool(LLMPool):
     """
     Class for handling a pool of LLM instances in separate processes for actual concurrency on heavy devices.
+    Worker processes are forked from a fork server, which imports the heavy model libraries only once.
+    Output queues of running workers are registered with a selector to await responses from multiple workers at once.
     """
 
+    def __init__(self, queue_spawns: bool = False, generation_timeout: float = None, max_batch_size: int = 16) -> None:
+        """
+        Initiation method.
+        :param queue_spawns: Queue up instanciation until resources are available.
+            Defaults to False.
+        :param generation_timeout: Timeout for generation tasks.
+            Defaults to None in which case the generation task potentially runs indefinitly.
+            If set, a None value will be returned if the timeout value is passed.
+        :param max_batch_size: Maximum number of pending prompts, a worker generates responses for at once.
+            Defaults to 16.
+        """
+        super().__init__(queue_spawns, generation_timeout, max_batch_size)
+        self.context = FORKSERVER_CONTEXT
+        self.selector = selectors.DefaultSelector()
+
+    def close(self) -> None:
+        """
+        Method for stopping workers and releasing the response selector.
+        """
+        super().close()
+        self.selector.close()
+
+    def generate_any(self, prompts: Dict[str, str]) -> Optional[Tuple[str, Any]]:
+        """
+        Request generation responses from multiple target LLMs and return the first available response.
+        Responses of the remaining workers are discarded.
+        :param prompts: Dictionary, mapping target workers to prompts.
+        :return: Tuple of target worker and response of the first answering worker
+            or None, if the generation timeout is passed.
+        """
+        requests = {}
+        for target_worker in prompts:
+            request_id = uuid4().hex
+            with self.workers[target_worker]["condition"]:
+                self.workers[target_worker]["responses"][request_id] = None
+            if self._submit_request(target_worker, request_id, prompts[target_worker]):
+                requests[target_worker] = request_id
+            else:
+                with self.workers[target_worker]["condition"]:
+                    self.workers[target_worker]["responses"].pop(
+                        request_id, None)
+        if not requests:
+            return None
+        deadline = None if self.generation_timeout is None else monotonic() + \
+            self.generation_timeout
+        result = None
+        try:
+            while result is None:
+                for target_worker in requests:
+                    with self.workers[target_worker]["condition"]:
+                        response = self.workers[target_worker]["responses"].get(
+                            requests[target_worker])
+                    if response is not None:
+                        result = (target_worker, response[0])
+                        break
+                else:
+                    timeout = 0.5 if deadline is None else min(
+                        0.5, deadline - monotonic())
+                    if timeout <= 0:
+                        break
+                    for key, _ in self.selector.select(timeout):
+                        self._collect_response(key.data)
+        finally:
+            for target_worker in requests:
+                with self.workers[target_worker]["condition"]:
+                    self.workers[target_worker]["responses"].pop(
+                        requests[target_worker], None)
+        return result
+
+    def _collect_response(self, target_worker: str) -> None:
+        """
+        Internal method for collecting an available response from the output queue of a worker.
+        :param target_worker: Target worker.
+        """
+        worker = self.workers[target_worker]
+        with worker["condition"]:
+            try:
+                response_id, response = worker["output"].get_nowait()
+            except Empty:
+                return
+            if response_id in worker["responses"]:
+                worker["responses"][response_id] = (response,)
+            worker["condition"].notify_all()
+
     def _load_llm(self, target_worker: str) -> None:
         """
         Internal method for loading LLM.
         :param target_worker: Worker to start.
         """
-        self.workers[target_worker]["switch"] = mp_get_event()
-        self.workers[target_worker]["input"] = MPQueue()
-        self.workers[target_worker]["output"] = MPQueue()
-        self.workers[target_worker]["worker"] = Process(
+        self.workers[target_worker]["switch"] = self.context.Event()
+        self.workers[target_worker]["input"] = SharedMemoryRingBuffer(
+            context=self.context)
+        self.workers[target_worker]["output"] = self.context.Queue()
+        self.workers[target_worker]["worker"] = self.context.Process(
             target=run_multiprocessed_llm,
             args=(
                 self.workers[target_worker]["switch"],
                 self.workers[target_worker]["config"],
                 self.workers[target_worker]["input"],
                 self.workers[target_worker]["output"],
+                self.max_batch_size,
+                spawn_language_model_instance
             )
         )
         self.workers[target_worker]["worker"].start()
+        self.selector.register(
+            self.workers[target_worker]["output"]._reader, selectors.EVENT_READ, target_worker)
         self.workers[target_worker]["running"] = True
 
     def _unload_llm(self, target_worker: str) -> None:
@@ -251,21 +700,10 @@ class MulitprocessingLLMPool(LLMPool):
         Internal method for unloading LLM.
         :param target_worker: Worker to stop.
         """
+        self.selector.unregister(self.workers[target_worker]["output"]._reader)
         self.workers[target_worker]["switch"].set()
         self.workers[target_worker]["worker"].join(1)
         if self.workers[target_worker]["worker"].exitcode != 0:
             self.workers[target_worker]["worker"].kill()
+        self.workers[target_worker]["input"].close()
         self.workers[target_worker]["running"] = False
-
-    def generate(self, target_worker: str, prompt: str) -> Optional[Any]:
-        """
-        Request generation response for query from target LLM.
-        :param target_worker: Target worker.
-        :param prompt: Prompt to send.
-        :return: Response.
-        """
-        self.workers[target_worker]["input"].put(prompt)
-        try:
-            return self.workers[target_worker]["output"].get(timeout=self.generation_timeout)
-        except Empty:
-            return None
@@ -7,12 +7,17 @@
 """
 import os
 import requests
-import json
-import copy
-from time import sleep
+import asyncio
+import httpx
+from diskcache import Cache
+from functools import wraps, lru_cache
+from time import sleep, time, monotonic
 from urllib.parse import urlparse
+from concurrent.futures import ThreadPoolExecutor
+from queue import Queue, Full
+from threading import Event
 import shutil
-from typing import Any, Optional, List, Tuple
+from typing import Any, Optional, List, Tuple, Generator
 from src.utility.bronze import time_utility, json_utility, requests_utility
 from src.utility.silver import image_utility, internet_utility, file_system_utility, environment_utility
 from src.model.plugin_control.plugins import GenericPlugin, PluginImportException
@@ -20,6 +25,178 @@ from src.configuration import configuration as cfg
 import abc
 
 
+# Dictionary, mapping Civitai model types to tasks
+CIVITAI_TYPE_TO_TASK = {
+    "checkpoint": "image_generation",
+    "textualinversion": "image_generation_guidance",
+    "hypernetwork": "image_generation_guidance",
+    "aestheticgradient": "image_generation_guidance",
+    "lora": "image_generation_guidance",
+    "locon": "image_generation_guidance",
+    "loha": "image_generation_guidance",
+    "embedding": "image_generation_guidance",
+    "lycoris": "image_generation_guidance",
+    "vae": "image_generation_guidance",
+    "controlnet": "image_generation_guidance",
+    "poses": "image_generation_guidance",
+    "wildcards": "image_generation_guidance",
+    "upscaler": "image_upscaling",
+    "other": None,
+}
+# Huggingface model file formats in order of preference
+HUGGINGFACE_MODEL_FORMATS = ("safetensors", "bin", "pt", "pth")
+# Time in seconds, for which connection check results are reused
+CONNECTION_CHECK_TTL = 30.0
+# Maximum number of fetched model data batches, waiting to be handed over to a callback
+PAGE_QUEUE_SIZE = 8
+# Maximum number of model data entries, handed over to a callback at once
+MODEL_BATCH_SIZE = 32
+# URL parameters, marking paginated listings, which are excluded from caching
+PAGINATION_PARAMETERS = ("cursor=", "page=", "limit=")
+API_CACHE: Optional[Cache] = None
+
+
+def get_api_cache() -> Cache:
+    """
+    Function for getting the persistent API response cache.
+    :return: API response cache.
+    """
+    global API_CACHE
+    if API_CACHE is None:
+        API_CACHE = Cache(cfg.PATHS.MODEL_CONTROL_API_CACHE)
+    return API_CACHE
+
+
+def cached_api_response(expire: float = 600) -> Any:
+    """
+    Decorator for persistently caching API responses of wrapper fetching methods by source and URL.
+    Empty responses and paginated listings are not cached.
+    :param expire: Time in seconds, after which cached responses expire.
+        Defaults to 600.
+    :return: Decorator.
+    """
+    def wrapper(func: Any) -> Any:
+        """
+        Function wrapper.
+        :param func: Wrapped function.
+        :return: Wrapped function.
+        """
+        @wraps(func)
+        def inner(self: Any, url: str, *args: Optional[Any], **kwargs: Optional[Any]) -> Any:
+            """
+            Inner function wrapper.
+            :param self: API wrapper instance.
+            :param url: Target URL.
+            :param args: Arguments.
+            :param kwargs: Keyword arguments.
+            :return: Fetched data.
+            """
+            if any(parameter in url for parameter in PAGINATION_PARAMETERS):
+                return func(self, url, *args, **kwargs)
+            cache = get_api_cache()
+            key = (self.get_source_name(), url)
+            entry = cache.get(key)
+            if entry is not None:
+                return entry["data"]
+            data = func(self, url, *args, **kwargs)
+            if data and (not isinstance(data, tuple) or data[0]):
+                cache.set(key, {"data": data, "fetched_at": time()},
+                          expire=expire)
+            return data
+        return inner
+    return wrapper
+
+
+def get_default_callback(result: list) -> Any:
+    """
+    Function for getting the default scraping callback, collecting batches of entries into a result list.
+    :param result: Result list.
+    :return: Callback, taking a list of entries.
+    """
+    return result.extend
+
+
+@lru_cache(maxsize=4096)
+def parse_host(url: str) -> str:
+    """
+    Function for parsing the host of a URL.
+    :param url: URL.
+    :return: Host of the URL.
+    """
+    return urlparse(url).netloc
+
+
+def get_rate_limit_delay(headers: Any, default: float) -> float:
+    """
+    Function for extracting the delay until a rate limit is lifted from response headers.
+    :param headers: Response headers, potentially containing 'Retry-After' or 'X-RateLimit-Reset' entries.
+    :param default: Default delay in seconds.
+    :return: Delay in seconds.
+    """
+    for header in ["Retry-After", "X-RateLimit-Reset"]:
+        value = headers.get(header)
+        if value is not None and value.replace(".", "", 1).isdigit():
+            delay = float(value)
+            # Reset is either given as epoch timestamp or as delta in seconds
+            return max(delay - time(), 0.0) if delay > time() else delay
+    return default
+
+
+class AdjustableRateLimiter(object):
+    """
+    Class, representing an asynchronous leaky bucket rate limiter with an adjustable rate.
+    The bucket holds up to the maximum rate of requests and drips at the maximum rate per time period.
+    """
+
+    def __init__(self, max_rate: float, time_period: float = 60.0) -> None:
+        """
+        Initiation method.
+        :param max_rate: Maximum number of requests per time period.
+        :param time_period: Time period in seconds.
+            Defaults to 60.0.
+        """
+        self.max_rate = max_rate
+        self.time_period = time_period
+        self.level = 0.0
+        self.last_leak = monotonic()
+
+    def leak(self) -> None:
+        """
+        Method for dripping the requests, which passed since the last leak, from the bucket.
+        """
+        now = monotonic()
+        self.level = max(
+            self.level - (now - self.last_leak) * self.max_rate / self.time_period, 0.0)
+        self.last_leak = now
+
+    def set_rate(self, max_rate: float) -> None:
+        """
+        Method for changing the rate.
+        Tasks, already waiting on the limiter, are throttled with the changed rate.
+        :param max_rate: Maximum number of requests per time period.
+        """
+        self.leak()
+        self.max_rate = max_rate
+
+    def fill(self) -> None:
+        """
+        Method for filling the bucket, so that no burst of requests is let through.
+        """
+        self.leak()
+        self.level = self.max_rate
+
+    async def acquire(self) -> None:
+        """
+        Method for waiting until a request can be sent without exceeding the rate.
+        """
+        while True:
+            self.leak()
+            if self.level + 1 <= self.max_rate:
+                self.level += 1
+                return
+            await asyncio.sleep((self.level + 1 - self.max_rate) * self.time_period / self.max_rate)
+
+
 class AbstractAPIWrapper(abc.ABC):
     """
     Abstract class, representing a API wrapper object.
@@ -33,6 +210,7 @@ class AbstractAPIWrapper(abc.ABC):
             Defaults to None.
         """
         self.access_token = access_token
+        self._connection_check = (-CONNECTION_CHECK_TTL, False)
 
     @abc.abstractclassmethod
     def get_source_name(cls) -> str:
@@ -44,11 +222,23 @@ class AbstractAPIWrapper(abc.ABC):
 
     def check_connection(self, **kwargs: Optional[dict]) -> bool:
         """
-        Abstract method for checking connection.
+        Method for checking connection.
+        The connection is checked via a HEAD request to the base URL of the wrapper, results are reused for a short time.
         :param kwargs: Arbitrary keyword arguments.
+            'force': Flag, declaring whether to ignore a cached result.
         :return: True if connection was established successfuly else False.
         """
-        pass
+        checked, result = self._connection_check
+        if kwargs.get("force", False) or monotonic() - checked > CONNECTION_CHECK_TTL:
+            try:
+                result = self.session.head(
+                    self.base_url, allow_redirects=True, timeout=5).status_code < 400
+            except requests.exceptions.RequestException:
+                result = False
+            self._connection_check = (monotonic(), result)
+            self._logger.info("Connection was successfuly established.") if result else self._logger.warning(
+                "Connection could not be established.")
+        return result
 
     @abc.abstractmethod
     def validate_url_responsiblity(self, url: str, **kwargs: Optional[dict]) -> bool:
@@ -96,6 +286,7 @@ class AbstractAPIWrapper(abc.ABC):
     def normalize_metadata(self, target_type: str, metadata: dict, **kwargs: Optional[dict]) -> dict:
         """
         Abstract method for normalizing metadata.
+        Note, that the normalized metadata references the given metadata instead of copying it.
         :param target_type: Type of target object.
         :param metadata: Metadata.
         :param kwargs: Arbitrary keyword arguments.
@@ -136,6 +327,106 @@ class AbstractAPIWrapper(abc.ABC):
         """
         pass
 
+    def _create_async_client(self) -> httpx.AsyncClient:
+        """
+        Internal method for creating an asynchronous HTTP/2 client.
+        Requests to the same host are multiplexed over shared connections.
+        :return: Asynchronous client.
+        """
+        return httpx.AsyncClient(headers=self.headers,
+                                 http2=True,
+                                 follow_redirects=True,
+                                 limits=httpx.Limits(max_connections=100, max_keepalive_connections=20))
+
+    def _set_up_rate_limiter(self, max_rate: float, time_period: float) -> None:
+        """
+        Internal method for setting up the rate limiter for asynchronous requests.
+        :param max_rate: Maximum number of requests per time period.
+        :param time_period: Time period in seconds.
+        """
+        self._limiter = AdjustableRateLimiter(max_rate, time_period)
+        self._base_rate = max_rate
+        self._rate_limited_until = 0.0
+
+    def _adjust_rate_limiter(self, headers: Any) -> None:
+        """
+        Internal method for lowering the request rate after being rate limited.
+        The rate is halved, or reduced to the advertised 'X-RateLimit-Limit', if it is lower.
+        The bucket is filled to prevent a burst of requests and further rate limit responses are ignored
+        for one time period, so that concurrent responses lower the rate only once.
+        :param headers: Response headers.
+        """
+        if monotonic() < self._rate_limited_until:
+            return
+        max_rate = max(self._limiter.max_rate / 2, 1.0)
+        limit = headers.get("X-RateLimit-Limit")
+        if limit is not None and limit.isdigit() and 0 < int(limit) < max_rate:
+            max_rate = float(limit)
+        self._limiter.set_rate(max_rate)
+        self._limiter.fill()
+        self._rate_limited_until = monotonic() + self._limiter.time_period
+
+    def _recover_rate_limiter(self) -> None:
+        """
+        Internal method for gradually raising a lowered request rate after successful requests.
+        Once the cooldown of the last adjustment passed, every successful request raises the rate by one request per
+        time period until the initial rate is reached.
+        """
+        if self._limiter.max_rate < self._base_rate and monotonic() >= self._rate_limited_until:
+            self._limiter.set_rate(
+                min(self._limiter.max_rate + 1.0, self._base_rate))
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """
+        Internal method for getting the semaphore, bounding the number of concurrent requests.
+        Semaphores are bound to an event loop, so a new semaphore is created for every running event loop.
+        :return: Semaphore.
+        """
+        loop = asyncio.get_running_loop()
+        if self._semaphore_loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+            self._semaphore_loop = loop
+        return self._semaphore
+
+    async def _run_page_pipeline(self, producer: Any, consumer: Any, page_queue: asyncio.Queue) -> None:
+        """
+        Internal method for running a page producer and a page consumer together.
+        If either of both fails, the other one is cancelled, so that producers do not block on a full queue,
+        and the exception is re-raised.
+        :param producer: Producer coroutine, putting model data batches into the queue.
+        :param consumer: Consumer coroutine, getting model data batches from the queue until None is received.
+        :param page_queue: Queue, connecting producer and consumer.
+        """
+        async def produce() -> None:
+            await producer
+            await page_queue.put(None)
+
+        tasks = [asyncio.create_task(produce()),
+                 asyncio.create_task(consumer)]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+    async def _consume_pages(self, page_queue: asyncio.Queue, callback: Any, batch_size: int = MODEL_BATCH_SIZE) -> None:
+        """
+        Internal method for handing over fetched model data batches to a callback.
+        The callback runs in a separate thread so that fetching continues while it is running.
+        :param page_queue: Queue to get model data batches from.
+        :param callback: Callback to call with collected model data batches.
+        :param batch_size: Maximum number of model data entries per callback call.
+            Defaults to MODEL_BATCH_SIZE.
+        """
+        while True:
+            items = await page_queue.get()
+            if items is None:
+                break
+            for index in range(0, len(items), batch_size):
+                await asyncio.to_thread(callback, items[index:index+batch_size])
+
 
 class APIWrapperPlugin(GenericPlugin):
     """
@@ -194,12 +485,25 @@ class CivitaiAPIWrapper(AbstractAPIWrapper):
         self._logger = cfg.LOGGER
         self.authorization = cfg.ENV["CIVITAI_API_KEY"]
         self.headers = {"Authorization": self.authorization}
+        self.session = requests_utility.get_session(
+            headers=self.headers, pool_maxsize=64)
         self.base_url = "https://civitai.com/"
+        self._host = parse_host(self.base_url)
         self.api_base_url = f"{self.base_url}api/v1"
         self.modelversion_api_endpoint = f"{self.api_base_url}/model-versions/"
         self.modelversion_by_hash_endpoint = f"{self.modelversion_api_endpoint}/by-hash/"
         self.model_api_endpoint = f"{self.api_base_url}/models/"
+        self._build_model_url = (self.model_api_endpoint + "{}").format
+        self._build_modelversion_url = (
+            self.modelversion_api_endpoint + "{}").format
         self.wait = 1.5
+        self.concurrency = 64
+        self._normalizers = {"model": self._normalize_model,
+                             "modelversion": self._normalize_modelversion}
+        self._connection_check = (-CONNECTION_CHECK_TTL, False)
+        self._semaphore = None
+        self._semaphore_loop = None
+        self._set_up_rate_limiter(40, 60)
 
     def get_source_name(self) -> str:
         """
@@ -208,17 +512,6 @@ class CivitaiAPIWrapper(AbstractAPIWrapper):
         """
         return "civitai"
 
-    def check_connection(self, **kwargs: Optional[dict]) -> bool:
-        """
-        Method for checking connection.
-        :param kwargs: Arbitrary keyword arguments.
-        :return: True if connection was established successfuly else False.
-        """
-        result = requests.get(self.base_url).status_code == 200
-        self._logger.info("Connection was successfuly established.") if result else self._logger.warn(
-            "Connection could not be established.")
-        return result
-
     def validate_url_responsiblity(self, url: str, **kwargs: Optional[dict]) -> bool:
         """
         Method for validating the responsiblity for a URL.
@@ -226,7 +519,7 @@ class CivitaiAPIWrapper(AbstractAPIWrapper):
         :param kwargs: Arbitrary keyword arguments.
         :return: True, if wrapper is responsible for URL else False.
         """
-        return urlparse(url).netloc in self.base_url
+        return parse_host(url) == self._host
 
     def scrape_available_targets(self, target_type: str, **kwargs: Optional[dict]) -> List[dict]:
         """
@@ -234,52 +527,158 @@ class CivitaiAPIWrapper(AbstractAPIWrapper):
         :param target_type: Type of target object.
         :param kwargs: Arbitrary keyword arguments.
             'callback': A callback for adding batches of scraping results while scraping process runs.
+                The callback is always called with a list of entries.
                 If a callback for adding results is given, this method will return an empty list.
-            'model': A target model for constraining target model versions to be scraped.
+            'model': A target model or a list of target models for constraining target model versions to be scraped.
         :return: List of entries of given target type.
         """
         result = []
         callback = kwargs.get("callback")
         if callback is None:
-            def callback(x: Any) -> None: result.extend(
-                x) if isinstance(x, list) else result.append(x)
+            callback = get_default_callback(result)
         if target_type == "model":
             self.collect_models_via_api(callback)
         elif target_type == "modelversion":
             target_model = kwargs.get("model")
             if target_model is not None:
-                metadata = self.safely_fetch_api_data(
-                    target_model.url) if target_model.metadata is None else target_model.metadata
-                if metadata is not None:
-                    callback(metadata["modelVersions"])
+                target_models = target_model if isinstance(
+                    target_model, list) else [target_model]
+                metadata_entries = [
+                    model.metadata for model in target_models if model.metadata is not None]
+                metadata_entries.extend(self.safely_fetch_api_data_batch(
+                    [model.url for model in target_models if model.metadata is None]))
+                for metadata in metadata_entries:
+                    if metadata:
+                        callback(metadata["modelVersions"])
             else:
-                def modelversion_callback_gateway(x: Any) -> None:
-                    if not isinstance(x, list):
-                        x = [x]
+                def modelversion_callback_gateway(x: List[dict]) -> None:
                     for entry in x:
                         callback(entry["modelVersions"])
                 self.collect_models_via_api(modelversion_callback_gateway)
         return result
 
-    def collect_models_via_api(self, callback: Any) -> None:
+    def collect_models_via_api(self, callback: Any, batch_size: int = MODEL_BATCH_SIZE) -> None:
         """
         Method for collecting model data via api.
         :param callback: Callback to call with collected model data batches.
+        :param batch_size: Maximum number of model data entries per batch.
+            Defaults to MODEL_BATCH_SIZE.
         """
-        next_url = self.model_api_endpoint
-        while next_url:
-            sleep(self.wait)
-            data = self.safely_fetch_api_data(next_url, current_try=1)
-            next_url = False
-            if isinstance(data, dict):
-                metadata = data["metadata"]
-                self._logger.info(f"Fetched metadata: {metadata}.")
-                next_url = metadata.get("nextPage")
-                if next_url and "limit=" not in next_url:
-                    next_url += "&limit=100"
-                callback(data["items"])
-            else:
-                self._logger.warning(f"Fetched data is no dictionary: {data}")
+        asyncio.run(self._collect_models_async(callback, batch_size))
+
+    def _get_page_url(self, url: str = None) -> str:
+        """
+        Internal method for getting a model page URL with the page size set.
+        :param url: Page URL.
+            Defaults to None in which case the URL of the first page is returned.
+        :return: Page URL.
+        """
+        if url is None:
+            return f"{self.model_api_endpoint}?limit=100"
+        return url if "limit=" in url else url + "&limit=100"
+
+    def iter_model_batches(self, batch_size: int = MODEL_BATCH_SIZE) -> Generator[List[dict], None, None]:
+        """
+        Method for lazily iterating over model data in small batches.
+        Model data is collected via the rate limited asynchronous collection in a single background worker,
+        so that following pages are already fetched while the caller processes a batch.
+        Only a bounded number of batches is buffered ahead of the caller.
+        :param batch_size: Maximum number of model data entries per batch.
+            Defaults to MODEL_BATCH_SIZE.
+        :return: Generator of model data batches.
+        """
+        batch_queue = Queue(maxsize=PAGE_QUEUE_SIZE)
+        stopped = Event()
+
+        def put(batch: Optional[List[dict]]) -> bool:
+            while not stopped.is_set():
+                try:
+                    batch_queue.put(batch, timeout=0.5)
+                    return True
+                except Full:
+                    continue
+            return False
+
+        def put_batch(batch: List[dict]) -> None:
+            if not put(batch):
+                raise InterruptedError("Iteration was stopped.")
+
+        def collect() -> None:
+            try:
+                self.collect_models_via_api(put_batch, batch_size)
+            finally:
+                put(None)
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            collection = executor.submit(collect)
+            try:
+                while (batch := batch_queue.get()) is not None:
+                    yield batch
+            finally:
+                stopped.set()
+            collection.result()
+
+    async def _collect_models_async(self, callback: Any, batch_size: int = MODEL_BATCH_SIZE) -> None:
+        """
+        Internal method for collecting model data via api.
+        Pages are fetched concurrently and handed over to a single consumer, calling the callback.
+        :param callback: Callback to call with collected model data batches.
+        :param batch_size: Maximum number of model data entries per batch.
+            Defaults to MODEL_BATCH_SIZE.
+        """
+        page_queue = asyncio.Queue(maxsize=PAGE_QUEUE_SIZE)
+        async with self._create_async_client() as session:
+            await self._run_page_pipeline(self._produce_pages(session, page_queue),
+                                          self._consume_pages(
+                                              page_queue, callback, batch_size),
+                                          page_queue)
+
+    async def _produce_pages(self, session: httpx.AsyncClient, page_queue: asyncio.Queue) -> None:
+        """
+        Internal method for fetching model pages into a queue.
+        Pages are fetched by a bounded number of concurrent fetchers, each waiting for the queue to accept its page
+        before fetching the next one, so that only a limited number of pages is held in memory.
+        :param session: Client session.
+        :param page_queue: Queue to put model data batches into.
+        """
+        start_url = self._get_page_url()
+        data = await self._safely_fetch_api_data_async(session, start_url)
+        if not isinstance(data, dict) or "items" not in data:
+            self._logger.warning(
+                "Collecting models failed, no model data was fetched: %s", data)
+            return
+        metadata = data["metadata"]
+        self._logger.info("Fetched metadata: %s.", metadata)
+        await page_queue.put(data["items"])
+
+        if metadata.get("totalPages"):
+            pages = iter(range(2, int(metadata["totalPages"]) + 1))
+
+            async def fetch_pages() -> None:
+                for page in pages:
+                    page_data = await self._safely_fetch_api_data_async(
+                        session, f"{start_url}&page={page}")
+                    if isinstance(page_data, dict) and "items" in page_data:
+                        await page_queue.put(page_data["items"])
+                    else:
+                        self._logger.warning(
+                            "Fetching page %s failed, collected model data is incomplete: %s", page, page_data)
+            await asyncio.gather(*[fetch_pages() for _ in range(min(self.concurrency, int(metadata["totalPages"]) - 1))])
+        else:
+            next_url = metadata.get("nextPage")
+            while next_url:
+                data = await self._safely_fetch_api_data_async(session, next_url)
+                next_url = False
+                if isinstance(data, dict) and "items" in data:
+                    metadata = data["metadata"]
+                    self._logger.info("Fetched metadata: %s.", metadata)
+                    next_url = metadata.get("nextPage")
+                    if next_url:
+                        next_url = self._get_page_url(next_url)
+                    await page_queue.put(data["items"])
+                else:
+                    self._logger.warning(
+                        "Collecting models stopped early, collected model data is incomplete: %s", data)
 
     def get_api_url(self, target_type: str, target_object: Any, **kwargs: Optional[dict]) -> Optional[str]:
         """
@@ -302,84 +701,164 @@ class CivitaiAPIWrapper(AbstractAPIWrapper):
         """
         return self.safely_fetch_api_data(target_object.url)
 
-    def safely_fetch_api_data(self, url: str, current_try: int = 3, max_tries: int = 3) -> dict:
+    @cached_api_response()
+    def safely_fetch_api_data(self, url: str, current_try: int = 0, max_tries: int = 3) -> dict:
         """
         Method for fetching API data.
+        Requests are retried with exponential backoff on rate limit, server, connection and deserialization errors.
+        Content is only deserialized for successful responses.
         :param url: Target URL.
         :param current_try: Current try.
-            Defaults to 3, which results in a single fetching try with max_tries at 3.
+            Defaults to 0.
         :param max_tries: Maximum number of tries.
             Defaults to 3.
         :return: Fetched data or empty dictionary.
         """
-        self._logger.info(
-            f"Fetching data for '{url}'...")
-        resp = requests.get(url, headers=self.headers)
-        try:
-            data = json.loads(resp.content)
-            if data is not None and not "error" in data:
-                self._logger.info(f"Fetching content was successful.")
-                return data
-            else:
-                self._logger.warn(f"Fetching metadata failed.")
-        except json.JSONDecodeError:
-            self._logger.warn(f"Response content could not be deserialized.")
-            if current_try < 3:
-                sleep(self.wait*2)
-                return self.safely_fetch_api_data(url, current_try+1)
-            else:
-                return {}
+        for current_try in range(current_try, max_tries):
+            backoff = self.wait * 2 ** current_try
+            self._logger.info(
+                "Fetching data for '%s'...", url)
+            try:
+                resp = self.session.get(url)
+                if resp.status_code == 429 or resp.status_code >= 500:
+                    self._logger.warning(
+                        "Fetching data failed with status %s.", resp.status_code)
+                    if resp.status_code == 429:
+                        backoff = get_rate_limit_delay(resp.headers, backoff)
+                elif resp.status_code >= 400:
+                    self._logger.warning(
+                        "Fetching data failed with status %s.", resp.status_code)
+                    return {}
+                else:
+                    data = json_utility.deserialize(resp.content)
+                    if data is not None and not "error" in data:
+                        self._logger.info("Fetching content was successful.")
+                        return data
+                    else:
+                        self._logger.warning("Fetching metadata failed.")
+                        return {}
+            except requests.exceptions.ConnectionError:
+                self._logger.warning("Connection failed.")
+            except ValueError:
+                self._logger.warning(
+                    "Response content could not be deserialized.")
+            if current_try < max_tries - 1:
+                sleep(backoff)
+        return {}
+
+    def safely_fetch_api_data_batch(self, urls: List[str]) -> List[dict]:
+        """
+        Method for fetching API data for multiple URLs concurrently.
+        :param urls: Target URLs.
+        :return: List of fetched data or empty dictionaries, ordered as the given URLs.
+        """
+        return asyncio.run(self._safely_fetch_api_data_batch_async(urls)) if urls else []
+
+    async def _safely_fetch_api_data_batch_async(self, urls: List[str]) -> List[dict]:
+        """
+        Internal method for fetching API data for multiple URLs concurrently.
+        :param urls: Target URLs.
+        :return: List of fetched data or empty dictionaries, ordered as the given URLs.
+        """
+        async with self._create_async_client() as session:
+            return await asyncio.gather(*[self._safely_fetch_api_data_async(session, url) for url in urls])
+
+    async def _safely_fetch_api_data_async(self, session: httpx.AsyncClient, url: str, max_tries: int = 3) -> dict:
+        """
+        Internal method for fetching API data asynchronously.
+        Requests are rate limited and retried with exponential backoff on rate limit and server errors.
+        Content is only deserialized for successful responses.
+        :param session: Client session.
+        :param url: Target URL.
+        :param max_tries: Maximum number of tries.
+            Defaults to 3.
+        :return: Fetched data or empty dictionary.
+        """
+        for current_try in range(max_tries):
+            backoff = self.wait * 2 ** current_try
+            await self._limiter.acquire()
+            async with self._get_semaphore():
+                self._logger.info("Fetching data for '%s'...", url)
+                try:
+                    resp = await session.get(url)
+                    if resp.status_code == 429 or resp.status_code >= 500:
+                        self._logger.warning(
+                            "Fetching data failed with status %s.", resp.status_code)
+                        if resp.status_code == 429:
+                            self._adjust_rate_limiter(resp.headers)
+                            backoff = get_rate_limit_delay(
+                                resp.headers, backoff)
+                    elif resp.status_code >= 400:
+                        self._logger.warning(
+                            "Fetching data failed with status %s.", resp.status_code)
+                        return {}
+                    else:
+                        data = json_utility.deserialize(resp.content)
+                        if data is not None and not "error" in data:
+                            self._logger.info(
+                                "Fetching content was successful.")
+                            self._recover_rate_limiter()
+                            return data
+                        else:
+                            self._logger.warning("Fetching metadata failed.")
+                            return {}
+                except httpx.HTTPError:
+                    self._logger.warning("Connection failed.")
+                except ValueError:
+                    self._logger.warning(
+                        "Response content could not be deserialized.")
+            if current_try < max_tries - 1:
+                await asyncio.sleep(backoff)
+        return {}
 
     def normalize_metadata(self, target_type: str, metadata: dict, **kwargs: Optional[dict]) -> dict:
         """
         Abstract method for normalizing metadata.
+        Note, that the normalized metadata references the given metadata instead of copying it.
         :param target_type: Type of target object.
         :param metadata: Metadata.
         :param kwargs: Arbitrary keyword arguments.
         :return: Normalized metadata.
         """
-        normalized = {}
-        if target_type == "model":
-            normalized = {
-                "name": metadata["name"],
-                "type": metadata["type"].upper(),
-                "task": {
-                    "checkpoint": "image_generation",
-                    "textualinversion": "image_generation_guidance",
-                    "hypernetwork": "image_generation_guidance",
-                    "aestheticgradient": "image_generation_guidance",
-                    "lora": "image_generation_guidance",
-                    "locon": "image_generation_guidance",
-                    "loha": "image_generation_guidance",
-                    "embedding": "image_generation_guidance",
-                    "lycoris": "image_generation_guidance",
-                    "vae": "image_generation_guidance",
-                    "controlnet": "image_generation_guidance",
-                    "poses": "image_generation_guidance",
-                    "wildcards": "image_generation_guidance",
-                    "upscaler": "image_upscaling",
-                    "other": None,
-                }[metadata["type"].lower()],
-                "architecture": "stablediffusion",
-                "meta_data": copy.deepcopy(metadata),
-                "url": f"{self.model_api_endpoint}{metadata['id']}",
-                "source": self.get_source_name()
-            }
-        elif target_type == "modelversion":
-            primary_file = [file for file in metadata["files"]
-                            if file.get("primary", False)]
-            primary_file = primary_file[0] if primary_file else metadata["files"][0] if metadata["files"] else {
-            }
-            normalized = {
-                "name": metadata["name"],
-                "basemodel": metadata["baseModel"],
-                "format": primary_file.get("metadata", {}).get("format"),
-                "type": primary_file.get("type"),
-                "meta_data": copy.deepcopy(metadata),
-                "url": f"{self.modelversion_api_endpoint}{metadata['id']}",
-                "source": self.get_source_name()
-            }
-        return normalized if normalized else metadata
+        normalizer = self._normalizers.get(target_type)
+        return metadata if normalizer is None else normalizer(metadata)
+
+    def _normalize_model(self, metadata: dict) -> dict:
+        """
+        Internal method for normalizing model metadata.
+        :param metadata: Model metadata.
+        :return: Normalized model metadata.
+        """
+        model_type = metadata["type"]
+        return {
+            "name": metadata["name"],
+            "type": model_type.upper(),
+            "task": CIVITAI_TYPE_TO_TASK.get(model_type.lower()),
+            "architecture": "stablediffusion",
+            "meta_data": metadata,
+            "url": self._build_model_url(metadata["id"]),
+            "source": self.get_source_name()
+        }
+
+    def _normalize_modelversion(self, metadata: dict) -> dict:
+        """
+        Internal method for normalizing modelversion metadata.
+        :param metadata: Modelversion metadata.
+        :return: Normalized modelversion metadata.
+        """
+        primary_file = [file for file in metadata["files"]
+                        if file.get("primary", False)]
+        primary_file = primary_file[0] if primary_file else metadata["files"][0] if metadata["files"] else {
+        }
+        return {
+            "name": metadata["name"],
+            "basemodel": metadata["baseModel"],
+            "format": primary_file.get("metadata", {}).get("format"),
+            "type": primary_file.get("type"),
+            "meta_data": metadata,
+            "url": self._build_modelversion_url(metadata["id"]),
+            "source": self.get_source_name()
+        }
 
     def download_model(self, model: Any, **kwargs: Optional[dict]) -> None:
         """
@@ -399,8 +878,8 @@ class CivitaiAPIWrapper(AbstractAPIWrapper):
                             os.path.join(backup_path, file))
         json_utility.save(model.metadata, os.path.join(
             path, f"m{model.id}_metadata.json"))
-        resp = requests.get(
-            f"{self.base_url}/models/{model.metadata['id']}", headers=self.headers)
+        resp = self.session.get(
+            f"{self.base_url}/models/{model.metadata['id']}")
         open(os.path.join(
             path, f"m{model.id}_modelcard_{time_utility.get_timestamp()}.html"), "w").write(resp.text)
 
@@ -439,8 +918,8 @@ class CivitaiAPIWrapper(AbstractAPIWrapper):
                 shutil.move(os.path.join(path, file), backupped_file_path)
             json_utility.save(modelversion.metadata, os.path.join(
                 path, f"mv{modelversion.id}_metadata.json"))
-        resp = requests.get(
-            f"{self.base_url}/models/{modelversion.metadata['modelId']}?modelVersionId={modelversion.metadata['id']}", headers=self.headers)
+        resp = self.session.get(
+            f"{self.base_url}/models/{modelversion.metadata['modelId']}?modelVersionId={modelversion.metadata['id']}")
         open(os.path.join(
             path, f"mv{modelversion.id}_modelcard_{time_utility.get_timestamp()}.html"), "w").write(resp.text)
 
@@ -494,10 +973,22 @@ class HuggingfaceAPIWrapper(AbstractAPIWrapper):
         """
         self._logger = cfg.LOGGER
         self.authorization = cfg.ENV["HUGGINGFACE_API_KEY"]
+        self.headers = {"Authorization": self.authorization}
+        self.session = requests_utility.get_session(
+            headers=self.headers, pool_maxsize=16)
         self.base_url = "https://huggingface.co/"
+        self._host = parse_host(self.base_url)
         self.api_base_url = f"{self.base_url}api"
         self.model_api_endpoint = f"{self.api_base_url}/models/"
+        self._build_model_url = (self.model_api_endpoint + "{}").format
         self.wait = 3.0
+        self.concurrency = 16
+        self._normalizers = {"model": self._normalize_model,
+                             "modelversion": self._normalize_modelversion}
+        self._connection_check = (-CONNECTION_CHECK_TTL, False)
+        self._semaphore = None
+        self._semaphore_loop = None
+        self._set_up_rate_limiter(20, 60)
 
     def get_source_name(self) -> str:
         """
@@ -506,17 +997,6 @@ class HuggingfaceAPIWrapper(AbstractAPIWrapper):
         """
         return "huggingface"
 
-    def check_connection(self, **kwargs: Optional[dict]) -> bool:
-        """
-        Method for checking connection.
-        :param kwargs: Arbitrary keyword arguments.
-        :return: True if connection was established successfuly else False.
-        """
-        result = requests.get(self.base_url).status_code == 200
-        self._logger.info("Connection was successfuly established.") if result else self._logger.warn(
-            "Connection could not be established.")
-        return result
-
     def validate_url_responsiblity(self, url: str, **kwargs: Optional[dict]) -> bool:
         """
         Method for validating the responsiblity for a URL.
@@ -524,7 +1004,7 @@ class HuggingfaceAPIWrapper(AbstractAPIWrapper):
         :param kwargs: Arbitrary keyword arguments.
         :return: True, if wrapper is responsible for URL else False.
         """
-        return urlparse(url).netloc in self.base_url
+        return parse_host(url) == self._host
 
     def scrape_available_targets(self, target_type: str, **kwargs: Optional[dict]) -> List[dict]:
         """
@@ -532,6 +1012,7 @@ class HuggingfaceAPIWrapper(AbstractAPIWrapper):
         :param target_type: Type of target object.
         :param kwargs: Arbitrary keyword arguments.
             'callback': A callback for adding batches of scraping results while scraping process runs.
+                The callback is always called with a list of entries.
                 If a callback for adding results is given, this method will return an empty list.
             'model': A target model for constraining target model versions to be scraped.
         :return: List of entries of given target type.
@@ -539,8 +1020,7 @@ class HuggingfaceAPIWrapper(AbstractAPIWrapper):
         result = []
         callback = kwargs.get("callback")
         if callback is None:
-            def callback(x: Any) -> None: result.extend(
-                x) if isinstance(x, list) else result.append(x)
+            callback = get_default_callback(result)
         if target_type == "model":
             self.collect_models_via_api(callback)
         elif target_type == "modelversion":
@@ -551,28 +1031,51 @@ class HuggingfaceAPIWrapper(AbstractAPIWrapper):
                 if metadata is not None:
                     callback([metadata])
             else:
-                def modelversion_callback_gateway(x: Any) -> None:
-                    if not isinstance(x, list):
-                        x = [x]
-                    for entry in x:
-                        callback(self.safely_fetch_api_data(
-                            self.model_api_endpoint + f"{entry['id']}")[0])
-                self.collect_models_via_api(modelversion_callback_gateway)
+                self.collect_models_via_api(callback, fetch_details=True)
 
         return result
 
-    def collect_models_via_api(self, callback: Any) -> None:
+    def collect_models_via_api(self, callback: Any, fetch_details: bool = False, batch_size: int = MODEL_BATCH_SIZE) -> None:
         """
         Method for collecting model data via api.
         :param callback: Callback to call with collected model data batches.
+        :param fetch_details: Flag, declaring whether to fetch the full model data for every collected model.
+            Defaults to False.
+        :param batch_size: Maximum number of model data entries per batch.
+            Defaults to MODEL_BATCH_SIZE.
+        """
+        asyncio.run(self._collect_models_async(
+            callback, fetch_details, batch_size))
+
+    async def _collect_models_async(self, callback: Any, fetch_details: bool = False, batch_size: int = MODEL_BATCH_SIZE) -> None:
+        """
+        Internal method for collecting model data via api.
+        Pages are fetched asynchronously and handed over to a single consumer, calling the callback.
+        :param callback: Callback to call with collected model data batches.
+        :param fetch_details: Flag, declaring whether to fetch the full model data for every collected model.
+            Defaults to False.
+        :param batch_size: Maximum number of model data entries per batch.
+            Defaults to MODEL_BATCH_SIZE.
+        """
+        page_queue = asyncio.Queue(maxsize=PAGE_QUEUE_SIZE)
+        async with self._create_async_client() as session:
+            await self._run_page_pipeline(self._produce_pages(session, page_queue),
+                                          self._consume_model_details(session, page_queue, callback, batch_size) if fetch_details else self._consume_pages(
+                                              page_queue, callback, batch_size),
+                                          page_queue)
+
+    async def _produce_pages(self, session: httpx.AsyncClient, page_queue: asyncio.Queue) -> None:
+        """
+        Internal method for fetching model pages into a queue.
+        Pages are chained via cursors in the 'link' header and are therefore fetched one after another.
+        :param session: Client session.
+        :param page_queue: Queue to put model data batches into.
         """
         next_url = self.model_api_endpoint + "?full=true&config=true"
         page = 1
         fetched_last_url = False
         while next_url:
-            sleep(self.wait)
-            data, header_data = self.safely_fetch_api_data(
-                next_url, current_try=1)
+            data, header_data = await self._safely_fetch_api_data_async(session, next_url)
             next_url = False
             if isinstance(data, list):
                 if not fetched_last_url:
@@ -584,12 +1087,89 @@ class HuggingfaceAPIWrapper(AbstractAPIWrapper):
                         if rel == "last":
                             fetched_last_url = True
                         self._logger.info(
-                            f"Fetched next url: '{next_url}' with relation '{rel}' as page {page}.")
+                            "Fetched next url: '%s' with relation '%s' as page %s.", next_url, rel, page)
 
-                callback(data)
+                await page_queue.put(data)
             else:
                 self._logger.warning(
-                    f"Fetched data is no list of entries: {data}")
+                    "Collecting models stopped early, collected model data is incomplete: %s", data)
+
+    async def _consume_model_details(self, session: httpx.AsyncClient, page_queue: asyncio.Queue, callback: Any, batch_size: int = MODEL_BATCH_SIZE) -> None:
+        """
+        Internal method for fetching full model data for fetched model data batches and handing it over to a callback.
+        Model data is fetched concurrently and handed over in batches in the order of arrival.
+        :param session: Client session.
+        :param page_queue: Queue to get model data batches from.
+        :param callback: Callback to call with full model data batches.
+        :param batch_size: Maximum number of model data entries per callback call.
+            Defaults to MODEL_BATCH_SIZE.
+        """
+        while True:
+            items = await page_queue.get()
+            if items is None:
+                break
+            batch = []
+            for next_response in asyncio.as_completed([self._safely_fetch_api_data_async(
+                    session, self._build_model_url(entry["id"])) for entry in items]):
+                data, _ = await next_response
+                if not data:
+                    self._logger.warning(
+                        "Fetching model data failed, collected model data is incomplete.")
+                    continue
+                batch.append(data)
+                if len(batch) == batch_size:
+                    await asyncio.to_thread(callback, batch)
+                    batch = []
+            if batch:
+                await asyncio.to_thread(callback, batch)
+
+    async def _safely_fetch_api_data_async(self, session: httpx.AsyncClient, url: str, max_tries: int = 3) -> Tuple[Any, dict]:
+        """
+        Internal method for fetching API data asynchronously.
+        Requests are rate limited and retried with exponential backoff on rate limit and server errors.
+        Content is only deserialized for successful responses.
+        :param session: Client session.
+        :param url: Target URL.
+        :param max_tries: Maximum number of tries.
+            Defaults to 3.
+        :return: Fetched data or empty dictionary and header data or empty dictionary.
+        """
+        for current_try in range(max_tries):
+            backoff = self.wait * 2 ** current_try
+            await self._limiter.acquire()
+            async with self._get_semaphore():
+                self._logger.info("Fetching data for '%s'...", url)
+                try:
+                    resp = await session.get(url)
+                    if resp.status_code == 429 or resp.status_code >= 500:
+                        self._logger.warning(
+                            "Fetching data failed with status %s.", resp.status_code)
+                        if resp.status_code == 429:
+                            self._adjust_rate_limiter(resp.headers)
+                            backoff = get_rate_limit_delay(
+                                resp.headers, backoff)
+                    elif resp.status_code >= 400:
+                        self._logger.warning(
+                            "Fetching data failed with status %s.", resp.status_code)
+                        return {}, {}
+                    else:
+                        data = json_utility.deserialize(resp.content)
+                        if data is not None and not "error" in data:
+                            self._logger.info(
+                                "Fetching content was successful with headers: %s.", resp.headers)
+                            self._recover_rate_limiter()
+                            return data, resp.headers if resp.headers else {}
+                        else:
+                            self._logger.warning("Fetching metadata failed.")
+                            return {}, {}
+                except httpx.HTTPError:
+                    self._logger.warning("Connection failed.")
+                except ValueError:
+                    self._logger.warning(
+                        "Response content could not be deserialized.")
+            if current_try < max_tries - 1:
+                await asyncio.sleep(backoff)
+        return {}, {}
 
     def get_api_url(self, target_type: str, target_object: Any, **kwargs: Optional[dict]) -> Optional[str]:
         """
@@ -611,68 +1191,99 @@ class HuggingfaceAPIWrapper(AbstractAPIWrapper):
         """
         return self.safely_fetch_api_data(target_object.url)[0]
 
-    def safely_fetch_api_data(self, url: str, current_try: int = 3, max_tries: int = 3) -> Tuple[dict]:
+    @cached_api_response()
+    def safely_fetch_api_data(self, url: str, current_try: int = 0, max_tries: int = 3) -> Tuple[dict]:
         """
         Method for fetching API data.
+        Requests are retried with exponential backoff on rate limit, server, connection and deserialization errors.
+        Content is only deserialized for successful responses.
         :param url: Target URL.
         :param current_try: Current try.
-            Defaults to 3, which results in a single fetching try with max_tries at 3.
+            Defaults to 0.
         :param max_tries: Maximum number of tries.
             Defaults to 3.
         :return: Fetched data or empty dictionary and header data or empty dictionary.
         """
-        self._logger.info(
-            f"Fetching data for '{url}'...")
-        resp = requests.get(url, headers={
-                            "Authorization": self.authorization})
-        try:
-            data = json.loads(resp.content)
-            if data is not None and not "error" in data:
-                self._logger.info(
-                    f"Fetching content was successful with headers: {resp.headers}.")
-                return data, resp.headers if resp.headers else {}
-            else:
-                self._logger.warn(f"Fetching metadata failed.")
-        except json.JSONDecodeError:
-            self._logger.warn(f"Response content could not be deserialized.")
-            if current_try < 3:
-                sleep(self.wait*2)
-                return self.safely_fetch_api_data(url, current_try+1)
-            else:
-                return {}
+        for current_try in range(current_try, max_tries):
+            backoff = self.wait * 2 ** current_try
+            self._logger.info(
+                "Fetching data for '%s'...", url)
+            try:
+                resp = self.session.get(url)
+                if resp.status_code == 429 or resp.status_code >= 500:
+                    self._logger.warning(
+                        "Fetching data failed with status %s.", resp.status_code)
+                    if resp.status_code == 429:
+                        backoff = get_rate_limit_delay(resp.headers, backoff)
+                elif resp.status_code >= 400:
+                    self._logger.warning(
+                        "Fetching data failed with status %s.", resp.status_code)
+                    return {}, {}
+                else:
+                    data = json_utility.deserialize(resp.content)
+                    if data is not None and not "error" in data:
+                        self._logger.info(
+                            "Fetching content was successful with headers: %s.", resp.headers)
+                        return data, resp.headers if resp.headers else {}
+                    else:
+                        self._logger.warning("Fetching metadata failed.")
+                        return {}, {}
+            except requests.exceptions.ConnectionError:
+                self._logger.warning("Connection failed.")
+            except ValueError:
+                self._logger.warning(
+                    "Response content could not be deserialized.")
+            if current_try < max_tries - 1:
+                sleep(backoff)
+        return {}, {}
 
     def normalize_metadata(self, target_type: str, metadata: dict, **kwargs: Optional[dict]) -> dict:
         """
         Abstract method for normalizing metadata.
+        Note, that the normalized metadata references the given metadata instead of copying it.
         :param target_type: Type of target object.
         :param metadata: Metadata.
         :param kwargs: Arbitrary keyword arguments.
         :return: Normalized metadata.
         """
-        normalized = {}
-        resp = requests.get(f"{self.base_url}{metadata['id']}")
+        normalizer = self._normalizers.get(target_type)
+        if normalizer is None:
+            return metadata
+        resp = self.session.get(f"{self.base_url}{metadata['id']}")
         metadata["modelcard"] = resp.text
-        if target_type == "model":
-            normalized = {
-                "name": metadata["id"],
-                "type": metadata.get("config", {}).get("model_type"),
-                "task": metadata.get("pipeline_tag", "").lower().replace("-", "_"),
-                "architecture": metadata.get("library_name"),
-                "meta_data": copy.deepcopy(metadata),
-                "url": f"{self.model_api_endpoint}{metadata['id']}",
-                "source": self.get_source_name()
-            }
-        elif target_type == "modelversion":
-            normalized = {
-                "name": metadata["id"],
-                "meta_data": copy.deepcopy(metadata),
-                "url": f"{self.model_api_endpoint}{metadata['id']}",
-                "source": self.get_source_name()
-            }
-            normalized.update(
-                self._extract_condense_modelversion_data(metadata))
+        return normalizer(metadata)
+
+    def _normalize_model(self, metadata: dict) -> dict:
+        """
+        Internal method for normalizing model metadata.
+        :param metadata: Model metadata.
+        :return: Normalized model metadata.
+        """
+        return {
+            "name": metadata["id"],
+            "type": metadata.get("config", {}).get("model_type"),
+            "task": metadata.get("pipeline_tag", "").lower().replace("-", "_"),
+            "architecture": metadata.get("library_name"),
+            "meta_data": metadata,
+            "url": self._build_model_url(metadata["id"]),
+            "source": self.get_source_name()
+        }
 
-        return normalized if normalized else metadata
+    def _normalize_modelversion(self, metadata: dict) -> dict:
+        """
+        Internal method for normalizing modelversion metadata.
+        :param metadata: Modelversion metadata.
+        :return: Normalized modelversion metadata.
+        """
+        normalized = {
+            "name": metadata["id"],
+            "meta_data": metadata,
+            "url": self._build_model_url(metadata["id"]),
+            "source": self.get_source_name()
+        }
+        normalized.update(
+            self._extract_condense_modelversion_data(metadata))
+        return normalized
 
     def _extract_condense_modelversion_data(self, metadata: dict) -> dict:
         """
@@ -680,11 +1291,10 @@ class HuggingfaceAPIWrapper(AbstractAPIWrapper):
         :param metadata: Raw modelversion metadata.
         :return: Condense modelversion data.
         """
-        format = None
-        for option in ["safetensors", "bin", "pt", "pth"]:
-            if any(file.get("rfilename", "").endswith("option") for file in metadata.get("siblings", [])):
-                format = option
-                break
+        suffixes = {file.get("rfilename", "").rsplit(".", 1)[-1].lower()
+                    for file in metadata.get("siblings", [])}
+        format = next(
+            (option for option in HUGGINGFACE_MODEL_FORMATS if option in suffixes), None)
         config = metadata.get("config", {})
         return {
             "basemodel": config.get("model_type"),
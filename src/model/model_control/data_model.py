@@ -5,10 +5,11 @@
 *            (c) 2023 Alexander Hering             *
 ****************************************************
 """
-from sqlalchemy.orm import relationship, mapped_column, declarative_base
-from sqlalchemy import Engine, Column, String, JSON, ForeignKey, Integer, DateTime, func, Uuid, Text, event, Boolean
+from sqlalchemy.orm import relationship, mapped_column, declarative_base, configure_mappers
+from sqlalchemy import Engine, Column, String, JSON, ForeignKey, Integer, DateTime, func, Uuid, Text, event, Boolean, Index
 from uuid import uuid4
-from typing import Any
+from typing import Any, Tuple
+from functools import lru_cache
 
 
 def populate_data_instrastructure(engine: Engine, schema: str, model: dict) -> None:
@@ -19,6 +20,19 @@ def populate_data_instrastructure(engine: Engine, schema: str, model: dict) -> N
     :param model: Model dictionary for holding data classes.
     """
     schema = str(schema)
+    base, dataclasses = _build_base(schema)
+    model.update(dataclasses)
+    base.metadata.create_all(bind=engine)
+
+
+@lru_cache(maxsize=8)
+def _build_base(schema: str) -> Tuple[Any, dict]:
+    """
+    Internal function for building the declarative base and data classes for a schema.
+    Results are cached, so that data classes are only mapped once per schema.
+    :param schema: Schema for tables.
+    :return: Declarative base and dictionary, mapping object types to data classes.
+    """
     base = declarative_base()
 
     class Model(base):
@@ -95,7 +109,8 @@ def populate_data_instrastructure(engine: Engine, schema: str, model: dict) -> N
         inactive = Column(Boolean, nullable=False, default=False,
                           comment="Inactivity flag.")
 
-        model_id = mapped_column(Integer, ForeignKey(f"{schema}model.id"))
+        model_id = mapped_column(
+            Integer, ForeignKey(f"{schema}model.id"), index=True)
         model = relationship(
             "Model", back_populates="modelversions")
         instances = relationship(
@@ -130,11 +145,12 @@ def populate_data_instrastructure(engine: Engine, schema: str, model: dict) -> N
         inactive = Column(Boolean, nullable=False, default=False,
                           comment="Inactivity flag.")
 
-        model_id = mapped_column(Integer, ForeignKey(f"{schema}model.id"))
+        model_id = mapped_column(
+            Integer, ForeignKey(f"{schema}model.id"), index=True)
         model = relationship(
             "Model", back_populates="instances")
         modelversion_id = mapped_column(
-            Integer, ForeignKey(f"{schema}modelversion.id"))
+            Integer, ForeignKey(f"{schema}modelversion.id"), index=True)
         modelversion = relationship(
             "Modelversion", back_populates="instances")
 
@@ -167,11 +183,12 @@ def populate_data_instrastructure(engine: Engine, schema: str, model: dict) -> N
         inactive = Column(Boolean, nullable=False, default=False,
                           comment="Inactivity flag.")
 
-        model_id = mapped_column(Integer, ForeignKey(f"{schema}model.id"))
+        model_id = mapped_column(
+            Integer, ForeignKey(f"{schema}model.id"), index=True)
         model = relationship(
             "Model", back_populates="assets")
         modelversion_id = mapped_column(
-            Integer, ForeignKey(f"{schema}modelversion.id"))
+            Integer, ForeignKey(f"{schema}modelversion.id"), index=True)
         modelversion = relationship(
             "Modelversion", back_populates="assets")
 
@@ -205,20 +222,23 @@ def populate_data_instrastructure(engine: Engine, schema: str, model: dict) -> N
         Log class, representing an log entry, connected to a machine learning model or model version interaction.
         """
         __tablename__ = f"{schema}log"
-        __table_args__ = {
-            "comment": "Log table.", "extend_existing": True}
+        __table_args__ = (
+            Index(f"ix_{schema.replace('.', '_')}log_responded_requested",
+                  "responded", "requested"),
+            {"comment": "Log table.", "extend_existing": True}
+        )
 
         id = Column(Integer, primary_key=True, autoincrement=True, unique=True, nullable=False,
                     comment="ID of the logging entry.")
         request = Column(JSON, nullable=False,
                          comment="Request, sent to the backend.")
         response = Column(JSON, comment="Response, given by the backend.")
-        requested = Column(DateTime, server_default=func.now(),
+        requested = Column(DateTime, server_default=func.now(), index=True,
                            comment="Timestamp of request recieval.")
         responded = Column(DateTime, server_default=func.now(), server_onupdate=func.now(),
                            comment="Timestamp of reponse transmission.")
 
-    for dataclass in [Model, Modelversion, Modelinstance, Asset, ScrapingFail, Log]:
-        model[dataclass.__tablename__.replace(schema, "")] = dataclass
-
-    base.metadata.create_all(bind=engine)
+    dataclasses = {dataclass.__tablename__.replace(schema, ""): dataclass
+                   for dataclass in [Model, Modelversion, Modelinstance, Asset, ScrapingFail, Log]}
+    configure_mappers()
+    return base, dataclasses
@@ -6,7 +6,9 @@
 ****************************************************
 """
 from typing import Any, Optional, List
-from src.utility.bronze import sqlalchemy_utility
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import IntegrityError
+from src.utility.bronze import sqlalchemy_utility, json_utility
 from datetime import datetime as dt
 from src.model.model_control.data_model import populate_data_instrastructure
 from src.utility.gold.filter_mask import FilterMask
@@ -21,7 +23,7 @@ class ModelDatabase(object):
     Class, representing a model database.
     """
 
-    def __init__(self, database_uri: str = None, schema: str = "", verbose: bool = False) -> None:
+    def __init__(self, database_uri: str = None, schema: str = "", verbose: bool = False, bulk_insert_chunk: int = 10_000) -> None:
         """
         Initiation method.
         :param database_uri: Database URI.
@@ -30,13 +32,25 @@ class ModelDatabase(object):
             Defaults to empty string in which case no schema is used.
         :param verbose: Verbose flag for interaction methods.
             Defaults to False since controllers should already be logging.
+        :param bulk_insert_chunk: Maximum number of rows to hand over to the database per bulk insertion call.
+            Defaults to 10000.
         """
         self._logger = cfg.LOGGER
         self.verbose = verbose
+        self.bulk_insert_chunk = bulk_insert_chunk
         self._logger.info("Automapping existing structures")
         self.base = sqlalchemy_utility.automap_base()
+        database_uri = cfg.ENV.get(
+            "MODEL_DB", f"sqlite:///{DEFAULT_DB_PATH}") if database_uri is None else database_uri
         self.engine = sqlalchemy_utility.get_engine(
-            cfg.ENV.get("MODEL_DB", f"sqlite:///{DEFAULT_DB_PATH}") if database_uri is None else database_uri)
+            database_uri,
+            json_serializer=json_utility.serialize,
+            json_deserializer=json_utility.deserialize,
+            **sqlalchemy_utility.get_bulk_insertion_kwargs(database_uri),
+            **sqlalchemy_utility.get_pooling_kwargs(database_uri))
+        if self.engine.dialect.name == "sqlite":
+            sqlalchemy_utility.set_sqlite_pragmas(
+                self.engine, {"journal_mode": "WAL", "synchronous": "NORMAL"})
         self.base.prepare(autoload_with=self.engine)
         self.session_factory = sqlalchemy_utility.get_session_factory(
             self.engine)
@@ -141,6 +155,57 @@ class ModelDatabase(object):
             session.refresh(obj)
         return getattr(obj, self.primary_keys[object_type])
 
+    def put_objects(self, object_type: str, unique_columns: List[str], object_attributes: List[dict]) -> int:
+        """
+        Method for adding objects in bulk via a single Core statement per batch.
+        Entries, colliding with existing entries on unique columns, are skipped instead of aborting the batch.
+        Dialects without conflict handling clause fall back to inserting entries one by one.
+        :param object_type: Target object type.
+        :param unique_columns: Unique columns to check for collisions.
+        :param object_attributes: List of object attribute dictionaries.
+        :return: Number of added objects, as reported by the database driver.
+        """
+        if not object_attributes:
+            return 0
+        table = self.model[object_type].__table__
+        dialect = self.engine.dialect.name
+        if dialect == "postgresql":
+            statement = postgresql.insert(table).on_conflict_do_nothing(
+                index_elements=unique_columns)
+        elif dialect == "sqlite":
+            statement = sqlite.insert(table).on_conflict_do_nothing(
+                index_elements=unique_columns)
+        elif dialect in ["mysql", "mariadb"]:
+            statement = table.insert().prefix_with("IGNORE")
+        else:
+            return self._put_objects_one_by_one(table, object_attributes)
+        added = 0
+        with self.engine.begin() as connection:
+            for index in range(0, len(object_attributes), self.bulk_insert_chunk):
+                added += connection.execute(
+                    statement, object_attributes[index:index+self.bulk_insert_chunk]).rowcount
+        return added
+
+    def _put_objects_one_by_one(self, table: Any, object_attributes: List[dict]) -> int:
+        """
+        Internal method for adding objects one by one, skipping entries which collide with existing entries.
+        Every entry is inserted within a savepoint, so that a collision only rolls back the colliding entry.
+        :param table: Target table.
+        :param object_attributes: List of object attribute dictionaries.
+        :return: Number of added objects.
+        """
+        added = 0
+        statement = table.insert()
+        with self.engine.begin() as connection:
+            for attributes in object_attributes:
+                try:
+                    with connection.begin_nested():
+                        connection.execute(statement, attributes)
+                    added += 1
+                except IntegrityError:
+                    pass
+        return added
+
     def patch_object(self, object_type: str, object_id: Any, **object_attributes: Optional[Any]) -> Optional[Any]:
         """
         Method for patching an object.
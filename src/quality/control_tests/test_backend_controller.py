@@ -9,6 +9,7 @@ import unittest
 import gc
 import os
 import shutil
+from datetime import datetime as dt, timedelta
 from src.control.backend_controller import BackendController, UUID
 from src.model.backend_control.llm_pool import LLMPool
 from src.configuration import configuration as cfg
@@ -97,6 +98,26 @@ class BackendControllerTest(unittest.TestCase):
         self.assertEqual(len(self.controller.get_objects("model")), 0)
         self.assertEqual(len(self.controller.get_objects("instance")), 0)
 
+    def test_04_log_archiving(self):
+        """
+        Method for testing the chunked deletion of outdated log entries.
+        """
+        outdated = dt.now() - timedelta(days=10)
+        self.controller.post_objects("log", [{"request": {"index": index}, "requested": outdated}
+                                             for index in range(5)])
+        self.controller.post_objects("log", [{"request": {"index": index}}
+                                             for index in range(5, 7)])
+        self.assertEqual(self.controller.archive_logs(5, chunk_size=2), 5)
+        remaining_logs = {log.id: log.request["index"]
+                          for log in self.controller.get_objects_by_type("log")}
+        self.assertEqual(len(remaining_logs), 2)
+        self.assertTrue(all(index >= 5 for index in remaining_logs.values()))
+        self.assertEqual(self.controller.archive_logs(5, chunk_size=2), 0)
+
+        for log_id in remaining_logs:
+            self.controller.delete_object("log", log_id)
+        self.assertEqual(len(self.controller.get_objects_by_type("log")), 0)
+
     @classmethod
     def setUpClass(cls):
         """
@@ -0,0 +1,167 @@
+# -*- coding: utf-8 -*-
+"""
+****************************************************
+*          Basic Language Model Backend            *
+*            (c) 2023 Alexander Hering             *
+****************************************************
+"""
+import unittest
+import asyncio
+from unittest import mock
+from time import monotonic
+from typing import Any, List, Tuple
+from src.configuration import configuration as cfg
+from src.model.model_control import api_wrapper
+
+
+TEST_PAGE_COUNT = api_wrapper.PAGE_QUEUE_SIZE * 3
+TEST_TIMEOUT = 10.0
+
+
+class APIWrapperTest(unittest.TestCase):
+    """
+    Test case class for testing the API wrappers.
+    """
+
+    def test_01_failing_civitai_callback(self) -> None:
+        """
+        Method for testing, that a failing callback stops collecting Civitai models instead of blocking the producers.
+        """
+        async def fetch_page(session: Any, url: str) -> dict:
+            return {"items": [{"id": url}], "metadata": {"totalPages": TEST_PAGE_COUNT}}
+
+        self.civitai_wrapper._safely_fetch_api_data_async = fetch_page
+        with self.assertRaises(RuntimeError):
+            asyncio.run(asyncio.wait_for(
+                self.civitai_wrapper._collect_models_async(self.failing_callback), TEST_TIMEOUT))
+
+    def test_02_failing_huggingface_callback(self) -> None:
+        """
+        Method for testing, that a failing callback stops collecting Huggingface models instead of blocking the producers.
+        """
+        async def fetch_page(session: Any, url: str) -> Tuple[Any, dict]:
+            return [{"id": url}], {"link": f"<{url}>; rel=\"next\""}
+
+        self.huggingface_wrapper._safely_fetch_api_data_async = fetch_page
+        for fetch_details in [False, True]:
+            with self.assertRaises(RuntimeError):
+                asyncio.run(asyncio.wait_for(
+                    self.huggingface_wrapper._collect_models_async(self.failing_callback, fetch_details), TEST_TIMEOUT))
+
+    def test_03_iterating_civitai_model_batches(self) -> None:
+        """
+        Method for testing the lazy iteration over Civitai model data batches.
+        """
+        async def fetch_page(session: Any, url: str) -> dict:
+            return {"items": [{"id": f"{url}_{index}"} for index in range(50)], "metadata": {"totalPages": 3}}
+
+        self.civitai_wrapper._safely_fetch_api_data_async = fetch_page
+        batches = list(self.civitai_wrapper.iter_model_batches(batch_size=32))
+        self.assertEqual(sum(len(batch) for batch in batches), 150)
+        self.assertTrue(all(len(batch) <= 32 for batch in batches))
+        self.assertEqual(len(set(entry["id"] for batch in batches for entry in batch)), 150)
+
+        iterator = self.civitai_wrapper.iter_model_batches(batch_size=32)
+        self.assertEqual(len(next(iterator)), 32)
+        iterator.close()
+
+    def test_04_rate_limiter(self) -> None:
+        """
+        Method for testing the adjustable rate limiter.
+        """
+        async def time_acquisitions(limiter: api_wrapper.AdjustableRateLimiter, count: int) -> float:
+            started = monotonic()
+            for _ in range(count):
+                await limiter.acquire()
+            return monotonic() - started
+
+        limiter = api_wrapper.AdjustableRateLimiter(4, 0.4)
+        self.assertLess(asyncio.run(time_acquisitions(limiter, 4)), 0.05)
+        self.assertGreaterEqual(asyncio.run(
+            time_acquisitions(limiter, 2)), 0.15)
+
+        limiter.set_rate(2)
+        limiter.fill()
+        self.assertEqual(limiter.level, 2)
+        self.assertGreaterEqual(asyncio.run(
+            time_acquisitions(limiter, 1)), 0.15)
+
+    def test_05_huggingface_format_detection(self) -> None:
+        """
+        Method for testing the detection of Huggingface model file formats.
+        """
+        metadata = {"siblings": [{"rfilename": "README.md"},
+                                 {"rfilename": "pytorch_model.bin"},
+                                 {"rfilename": "model.SAFETENSORS"}],
+                    "config": {"model_type": "llama", "architectures": ["LlamaForCausalLM"]}}
+        self.assertEqual(self.huggingface_wrapper._extract_condense_modelversion_data(metadata),
+                         {"basemodel": "llama", "type": ["LlamaForCausalLM"], "format": "safetensors"})
+        metadata["siblings"] = [{"rfilename": "README.md"},
+                                {"rfilename": "model.pt"}]
+        self.assertEqual(self.huggingface_wrapper._extract_condense_modelversion_data(
+            metadata)["format"], "pt")
+        metadata["siblings"] = [{"rfilename": "option"},
+                                {"rfilename": "config.json"}]
+        self.assertIsNone(self.huggingface_wrapper._extract_condense_modelversion_data(
+            metadata)["format"])
+        self.assertIsNone(self.huggingface_wrapper._extract_condense_modelversion_data({})[
+                          "format"])
+
+    def test_06_url_responsibility(self) -> None:
+        """
+        Method for testing the validation of URL responsibility by exact host matching.
+        """
+        for wrapper, host in [(self.civitai_wrapper, "civitai.com"), (self.huggingface_wrapper, "huggingface.co")]:
+            self.assertTrue(wrapper.validate_url_responsiblity(
+                f"https://{host}/api/models/1"))
+            self.assertFalse(wrapper.validate_url_responsiblity(
+                f"https://{host}.evil.org/api/models/1"))
+            self.assertFalse(wrapper.validate_url_responsiblity(
+                f"https://evil{host}/api/models/1"))
+            self.assertFalse(wrapper.validate_url_responsiblity(
+                f"https://www.{host}/api/models/1"))
+            self.assertFalse(
+                wrapper.validate_url_responsiblity("https://.com/"))
+
+    @staticmethod
+    def failing_callback(items: List[dict]) -> None:
+        """
+        Callback, failing on every call.
+        :param items: Model data batch.
+        """
+        raise RuntimeError("Callback failed.")
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Class method for setting up test case.
+        """
+        with mock.patch.dict(cfg.ENV, {"CIVITAI_API_KEY": "", "HUGGINGFACE_API_KEY": ""}):
+            cls.civitai_wrapper = api_wrapper.CivitaiAPIWrapper()
+            cls.huggingface_wrapper = api_wrapper.HuggingfaceAPIWrapper()
+
+    @classmethod
+    def tearDownClass(cls):
+        """
+        Class method for setting tearing down test case.
+        """
+        del cls.civitai_wrapper
+        del cls.huggingface_wrapper
+
+    @classmethod
+    def setup_class(cls):
+        """
+        Alternative class method for setting up test case.
+        """
+        cls.setUpClass()
+
+    @classmethod
+    def teardown_class(cls):
+        """
+        Alternative class for setting tearing down test case.
+        """
+        cls.tearDownClass()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -132,6 +132,34 @@ class DataModelTest(unittest.TestCase):
             self.assertTrue(isinstance(
                 instance.model, self.database.model["model"]))
 
+    def test_05_bulk_object_interaction(self) -> None:
+        """
+        Method for testing bulk object interaction.
+        """
+        model_count = self.database.get_object_count_by_type("model")
+        self.assertEqual(self.database.put_objects(
+            "model", ["url"], self.example_bulk_model_data), len(self.example_bulk_model_data))
+        self.assertEqual(self.database.get_object_count_by_type(
+            "model"), model_count + len(self.example_bulk_model_data))
+
+        self.database.put_objects(
+            "model", ["url"], self.example_bulk_model_data)
+        self.assertEqual(self.database.get_object_count_by_type(
+            "model"), model_count + len(self.example_bulk_model_data))
+
+    def test_06_indexes(self) -> None:
+        """
+        Method for testing lookup indexes.
+        """
+        for object_type in ["modelversion", "modelinstance", "asset"]:
+            for column in self.database.model[object_type].__table__.columns:
+                if column.foreign_keys:
+                    self.assertTrue(column.index)
+        log_indexes = [[column.name for column in index.columns]
+                       for index in self.database.model["log"].__table__.indexes]
+        self.assertTrue(["requested"] in log_indexes)
+        self.assertTrue(["responded", "requested"] in log_indexes)
+
     @classmethod
     def setUpClass(cls):
         """
@@ -165,6 +193,14 @@ class DataModelTest(unittest.TestCase):
         }
         cls.example_log_data = {"request":
                                 {"my_request_key": "my_request_value"}}
+        cls.example_bulk_model_data = [
+            {
+                "name": f"bulk_model_{index}",
+                "url": f"https://civitai.com/api/v1/models/{index}",
+                "source": "civitai",
+                "meta_data": {"id": index}
+            } for index in range(3)
+        ]
         cls.model_columns = ["id", "path", "name", "task", "type", "architecture",
                              "url", "source", "meta_data", "created", "updated", "inactive"]
         cls.modelversion_columns = ["id", "path", "name", "basemodel", "type", "format", "url", "source", "sha256",
@@ -183,16 +219,11 @@ class DataModelTest(unittest.TestCase):
         """
         Class method for setting tearing down test case.
         """
-        del cls.database
-        del cls.schema
-        del cls.example_model_data
-        del cls.example_modelinstance_data
-        del cls.example_log_data
-        del cls.model_columns
-        del cls.modelversion_columns
-        del cls.modelinstance_columns
-        del cls.asset_columns
-        del cls.log_columns
+        for attribute in ["database", "schema", "example_model_data", "example_modelinstance_data",
+                          "example_log_data", "example_bulk_model_data", "model_columns", "modelversion_columns",
+                          "modelinstance_columns", "asset_columns", "log_columns"]:
+            if hasattr(cls, attribute):
+                delattr(cls, attribute)
         if os.path.exists(cfg.PATHS.TEST_PATH):
             shutil.rmtree(cfg.PATHS.TEST_PATH, ignore_errors=True)
         gc.collect()
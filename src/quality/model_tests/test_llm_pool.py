@@ -7,42 +7,46 @@
 """
 import unittest
 import gc
-from time import sleep
+from time import sleep, monotonic
+from queue import Empty, Full
+from threading import Thread
 import multiprocessing.queues
-from typing import Optional, Any
+from collections import deque
+from typing import Optional, Any, List
 from src.configuration import configuration as cfg
 from src.model.backend_control import llm_pool as test_llm_pool
 
 
-def test_spawner(model_path: str, model_config: dict) -> Optional[Any]:
+class TestLM(object):
     """
-    Function for spawning test language model instance based on configuration.
-        :param model_path: Relative model path.
-        :param model_config: Model configuration.
-    :return: Language model instance if configuration was successful else None.
+    Test language model class.
     """
-    class TestLM(object):
+
+    def __init__(self, model_path: str, model_config: dict) -> None:
         """
-        Test language model class.
+        Initiation method.
+        :param model_path: Relative model path.
+        :param model_config: Model configuration, in this case translation dictionary for prompting.
         """
+        self.model_path = model_path
+        self.model_config = model_config
 
-        def __init__(self, model_path: str, model_config: dict) -> None:
-            """
-            Initiation method.
-            :param model_path: Relative model path.
-            :param model_config: Model configuration, in this case translation dictionary for prompting.
-            """
-            self.model_path = model_path
-            self.model_config = model_config
+    def generate(self, prompts: List[str]) -> Optional[List[Any]]:
+        """
+        Generation method.
+        :param prompts: User prompts.
+        :return: Responses, if generation method is available else None.
+        """
+        return [self.model_config[prompt] for prompt in prompts]
 
-        def generate(self, prompt: str) -> Optional[Any]:
-            """
-            Generation method.
-            :param prompt: User prompt.
-            :return: Response, if generation method is available else None.
-            """
-            return self.model_config[prompt]
 
+def test_spawner(model_path: str, model_config: dict) -> Optional[Any]:
+    """
+    Function for spawning test language model instance based on configuration.
+        :param model_path: Relative model path.
+        :param model_config: Model configuration.
+    :return: Language model instance if configuration was successful else None.
+    """
     return TestLM(model_path, model_config)
 
 
@@ -71,14 +75,21 @@ class ThreadedLLMPoolTest(unittest.TestCase):
         """
         Method for testing llm handling.
         """
-        self.assertEqual(len(list(self.llm_pool.workers.keys())), 1)
-        worker_uuid = list(self.llm_pool.workers.keys())[0]
+        self.assertEqual(self.llm_pool.worker_count, 1)
+        worker_uuid = self.llm_pool.first_worker()
         self.llm_pool.start(worker_uuid)
         worker_config = self.llm_pool.workers[worker_uuid]
         self.assertTrue(isinstance(
             worker_config["switch"], test_llm_pool.TEvent))
         self.assertTrue(isinstance(
-            worker_config["input"], test_llm_pool.TQueue))
+            self.llm_pool.request_queue, test_llm_pool.SimpleQueue))
+        self.assertTrue(self.llm_pool.dispatcher.is_alive())
+        self.assertTrue(isinstance(
+            worker_config["input"], test_llm_pool.EventDeque))
+        self.assertTrue(isinstance(
+            worker_config["input"].buffer, deque))
+        self.assertTrue(isinstance(
+            worker_config["input"].event, test_llm_pool.TEvent))
         self.assertTrue(isinstance(
             worker_config["output"], test_llm_pool.TQueue))
         self.assertTrue(worker_config["running"])
@@ -95,10 +106,10 @@ class ThreadedLLMPoolTest(unittest.TestCase):
         """
         Method for testing llm handling.
         """
-        self.assertEqual(len(list(self.llm_pool.workers.keys())), 1)
-        worker_uuid_a = list(self.llm_pool.workers.keys())[0]
+        self.assertEqual(self.llm_pool.worker_count, 1)
+        worker_uuid_a = self.llm_pool.first_worker()
         worker_uuid_b = self.llm_pool.prepare_llm(self.llm_test_config_b)
-        self.assertEqual(len(list(self.llm_pool.workers.keys())), 2)
+        self.assertEqual(self.llm_pool.worker_count, 2)
 
         self.llm_pool.start(worker_uuid_a)
         worker_config_a = self.llm_pool.workers[worker_uuid_a]
@@ -122,7 +133,7 @@ class ThreadedLLMPoolTest(unittest.TestCase):
         self.assertFalse(self.llm_pool.is_running(worker_uuid_b))
 
         worker_uuid_c = self.llm_pool.prepare_llm(self.llm_test_config_c)
-        self.assertEqual(len(list(self.llm_pool.workers.keys())), 3)
+        self.assertEqual(self.llm_pool.worker_count, 3)
         self.assertFalse(self.llm_pool.is_running(worker_uuid_c))
         self.llm_pool.start(worker_uuid_c)
         self.assertTrue(self.llm_pool.is_running(worker_uuid_c))
@@ -158,6 +169,8 @@ class ThreadedLLMPoolTest(unittest.TestCase):
         """
         Class method for setting up test case.
         """
+        cls.gc_was_enabled = gc.isenabled()
+        gc.disable()
         test_llm_pool.spawn_language_model_instance = test_spawner
         cls.llm_pool = test_llm_pool.ThreadedLLMPool(generation_timeout=6.0)
         cls.llm_test_config_a = {
@@ -194,12 +207,15 @@ class ThreadedLLMPoolTest(unittest.TestCase):
         """
         Class method for setting tearing down test case.
         """
+        cls.llm_pool.close()
         del cls.llm_pool
         del cls.llm_test_config_a
         del cls.llm_test_config_b
         del cls.llm_reset_config_b
         del cls.llm_test_config_c
         gc.collect()
+        if cls.gc_was_enabled:
+            gc.enable()
 
     @classmethod
     def setup_class(cls):
@@ -225,14 +241,14 @@ class MultiprocessingLLMPoolTest(ThreadedLLMPoolTest):
         """
         Method for testing llm handling.
         """
-        self.assertEqual(len(list(self.llm_pool.workers.keys())), 1)
-        worker_uuid = list(self.llm_pool.workers.keys())[0]
+        self.assertEqual(self.llm_pool.worker_count, 1)
+        worker_uuid = self.llm_pool.first_worker()
         self.llm_pool.start(worker_uuid)
         worker_config = self.llm_pool.workers[worker_uuid]
         self.assertTrue(isinstance(
             worker_config["switch"], test_llm_pool.MPEvent))
         self.assertTrue(isinstance(
-            worker_config["input"], multiprocessing.queues.Queue))
+            worker_config["input"], test_llm_pool.SharedMemoryRingBuffer))
         self.assertTrue(isinstance(
             worker_config["output"], multiprocessing.queues.Queue))
         self.assertTrue(worker_config["running"])
@@ -244,11 +260,33 @@ class MultiprocessingLLMPoolTest(ThreadedLLMPoolTest):
         self.llm_pool.stop(worker_uuid)
         self.assertFalse(worker_config["running"])
 
+    def test_04_generate_any(self):
+        """
+        Method for testing generation requests to multiple workers.
+        """
+        worker_uuid_a = self.llm_pool.prepare_llm(self.llm_test_config_a)
+        worker_uuid_c = self.llm_pool.prepare_llm(self.llm_test_config_c)
+        self.llm_pool.start(worker_uuid_a)
+        self.llm_pool.start(worker_uuid_c)
+        target_worker, response = self.llm_pool.generate_any(
+            {worker_uuid_a: "prompt_a", worker_uuid_c: "prompt_e"})
+        self.assertEqual(response, {worker_uuid_a: "response_a",
+                                    worker_uuid_c: "response_e"}[target_worker])
+        self.assertEqual(self.llm_pool.generate(
+            worker_uuid_a, "prompt_b"), "response_b")
+        self.assertEqual(self.llm_pool.generate(
+            worker_uuid_c, "prompt_f"), "response_f")
+        self.llm_pool.stop_all()
+        self.assertFalse(self.llm_pool.is_running(worker_uuid_a))
+        self.assertFalse(self.llm_pool.is_running(worker_uuid_c))
+
     @classmethod
     def setUpClass(cls):
         """
         Class method for setting up test case.
         """
+        cls.gc_was_enabled = gc.isenabled()
+        gc.disable()
         test_llm_pool.spawn_language_model_instance = test_spawner
         cls.llm_pool = test_llm_pool.MulitprocessingLLMPool(
             generation_timeout=6.0)
@@ -286,12 +324,113 @@ class MultiprocessingLLMPoolTest(ThreadedLLMPoolTest):
         """
         Class method for setting tearing down test case.
         """
+        cls.llm_pool.close()
         del cls.llm_pool
         del cls.llm_test_config_a
         del cls.llm_test_config_b
         del cls.llm_reset_config_b
         del cls.llm_test_config_c
         gc.collect()
+        if cls.gc_was_enabled:
+            gc.enable()
+
+
+class RequestBufferTest(unittest.TestCase):
+    """
+    Test case class for testing the request buffers of workers.
+    """
+
+    def test_01_ring_buffer_wrap_around(self):
+        """
+        Method for testing records, wrapping around the end of the ring buffer.
+        """
+        ring_buffer = test_llm_pool.SharedMemoryRingBuffer(
+            size=self.ring_buffer_size)
+        self.addCleanup(ring_buffer.close)
+        for index in range(10):
+            request = (f"id_{index}", f"prompt_{index}_ä")
+            ring_buffer.put(request)
+            self.assertEqual(ring_buffer.get(timeout=1.0), request)
+        self.assertGreater(ring_buffer.head.value, self.ring_buffer_size)
+        self.assertEqual(ring_buffer.head.value, ring_buffer.tail.value)
+        self.assertRaises(Empty, ring_buffer.get_nowait)
+
+    def test_02_ring_buffer_full(self):
+        """
+        Method for testing timeouts of putting into a full ring buffer.
+        """
+        ring_buffer = test_llm_pool.SharedMemoryRingBuffer(
+            size=self.ring_buffer_size)
+        self.addCleanup(ring_buffer.close)
+        request = ("id", "p" * (self.ring_buffer_size // 2 -
+                   test_llm_pool.RING_BUFFER_HEADER.size - 2))
+        ring_buffer.put(request)
+        ring_buffer.put(request)
+        self.assertRaises(Full, ring_buffer.put, request, 0.1)
+        self.assertEqual(ring_buffer.get_nowait(), request)
+        ring_buffer.put(request, 0.1)
+        self.assertRaises(ValueError, ring_buffer.put,
+                          ("id", "p" * self.ring_buffer_size))
+
+    def test_03_ring_buffer_closing(self):
+        """
+        Method for testing putting into a closed ring buffer.
+        """
+        ring_buffer = test_llm_pool.SharedMemoryRingBuffer(
+            size=self.ring_buffer_size)
+        ring_buffer.close()
+        self.assertTrue(ring_buffer.closed)
+        self.assertRaises(ValueError, ring_buffer.put, ("id", "prompt"))
+        ring_buffer.close()
+
+    def test_04_event_deque_wake_up(self):
+        """
+        Method for testing the wake up of a consumer, waiting on an empty event deque.
+        """
+        event_deque = test_llm_pool.EventDeque()
+        self.assertRaises(Empty, event_deque.get, 0.1)
+        self.assertRaises(Empty, event_deque.get_nowait)
+
+        producer = Thread(target=lambda: (sleep(0.2), event_deque.put(("id", "prompt"))))
+        started = monotonic()
+        producer.start()
+        self.assertEqual(event_deque.get(timeout=5.0), ("id", "prompt"))
+        self.assertLess(monotonic() - started, 2.0)
+        producer.join()
+
+        for index in range(3):
+            event_deque.put(index)
+        self.assertEqual([event_deque.get_nowait()
+                         for _ in range(3)], [0, 1, 2])
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Class method for setting up test case.
+        """
+        cls.ring_buffer_size = 64
+
+    @classmethod
+    def tearDownClass(cls):
+        """
+        Class method for setting tearing down test case.
+        """
+        del cls.ring_buffer_size
+        gc.collect()
+
+    @classmethod
+    def setup_class(cls):
+        """
+        Alternative class method for setting up test case.
+        """
+        cls.setUpClass()
+
+    @classmethod
+    def teardown_class(cls):
+        """
+        Alternative class for setting tearing down test case.
+        """
+        cls.tearDownClass()
 
 
 if __name__ == '__main__':
@@ -7,6 +7,11 @@
 """
 import json
 import os
+from typing import Any, Union
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
 def save(data: dict, path: str) -> None:
@@ -39,3 +44,27 @@ def is_json(path: str) -> bool:
         return True
     else:
         return False
+
+
+def serialize(data: Any) -> str:
+    """
+    Function for serializing data to a JSON string.
+    Values, which are not JSON serializable, are converted to their string representation.
+    :param data: Data to serialize.
+    :return: JSON string.
+    """
+    if orjson is not None:
+        return orjson.dumps(data, default=str, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+    return json.dumps(data, default=str)
+
+
+def deserialize(data: Union[str, bytes]) -> Any:
+    """
+    Function for deserializing data from a JSON string.
+    Raises a ValueError, if the data is not valid JSON.
+    :param data: JSON string or bytes.
+    :return: Deserialized data.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -10,6 +10,7 @@ from time import sleep
 from typing import Union, List, Any, Optional
 from . import json_utility
 import requests
+from requests.adapters import HTTPAdapter
 import math
 from lxml import html
 from tqdm import tqdm
@@ -41,15 +42,27 @@ def get_page_content(url: str) -> html.HtmlElement:
     return html.fromstring(page.content)
 
 
-def get_session(proxy_dict: dict = None) -> requests.Session:
+def get_session(proxy_dict: dict = None, headers: dict = None, pool_maxsize: int = None) -> requests.Session:
     """
     Function for getting requests session.
     :param proxy_dict: Proxy dictionary.
+    :param headers: Headers to send with every request.
+        Defaults to None.
+    :param pool_maxsize: Maximum number of pooled connections per host.
+        Defaults to None in which case the requests defaults are used.
+        Requests are not retried by the session, retry handling is left to the caller.
     :return: Session.
     """
     session = requests.session()
     if proxy_dict != None:
         session.proxies = proxy_dict
+    if headers is not None:
+        session.headers.update(headers)
+    if pool_maxsize is not None:
+        session.mount("https://", HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=pool_maxsize
+        ))
 
     return session
 
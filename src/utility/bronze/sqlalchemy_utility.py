@@ -9,12 +9,13 @@ import copy
 from enum import Enum
 from sqlalchemy import Column, String, Boolean, Integer, JSON, Text, DateTime, CHAR, ForeignKey, Table, Float, BLOB, Uuid, func
 from sqlalchemy.orm import Session, relationship
-from sqlalchemy import and_, or_, not_, select
+from sqlalchemy import and_, or_, not_, select, delete
 from sqlalchemy import create_engine
 from sqlalchemy.ext.automap import automap_base, classname_for_table
 from sqlalchemy.dialects.mysql import LONGTEXT
-from sqlalchemy import orm, inspect
-from sqlalchemy.engine import create_engine, Engine
+from sqlalchemy import orm, inspect, event
+from sqlalchemy.pool import StaticPool
+from sqlalchemy.engine import create_engine, Engine, make_url
 from sqlalchemy.sql import text
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.ext.automap import automap_base
@@ -81,20 +82,67 @@ SQLALCHEMY_TYPING_FROM_STRING_DICTIONARY = {
 }
 
 
-def get_engine(engine_url: str, pool_recycle: int = 280, encoding: str = "utf-8") -> Engine:
+def get_engine(engine_url: str, pool_recycle: int = 280, encoding: str = "utf-8", **engine_kwargs: Optional[Any]) -> Engine:
     """
     Function for getting database engine.
     :param engine_url: URL to create engine for.
     :param pool_recycle: Parameter for preventing the reuse of connections that were stale for some time.
     :param encoding: Encoding string. Defaults to 'utf-8'.
+    :param engine_kwargs: Additional keyword arguments for engine creation.
     :return: Engine to given database.
     """
     try:
         # SQLAlchemy 1.4
-        return create_engine(engine_url, encoding=encoding, pool_recycle=pool_recycle)
+        return create_engine(engine_url, encoding=encoding, pool_recycle=pool_recycle, **engine_kwargs)
     except TypeError:
         # SQLAlchemy 2.0
-        return create_engine(engine_url, pool_recycle=pool_recycle)
+        return create_engine(engine_url, pool_recycle=pool_recycle, **engine_kwargs)
+
+
+def get_bulk_insertion_kwargs(engine_url: str, page_size: int = 1000) -> dict:
+    """
+    Function for getting engine keyword arguments for efficient bulk insertion.
+    :param engine_url: URL to create engine for.
+    :param page_size: Number of rows to insert per statement.
+        Defaults to 1000.
+    :return: Engine keyword arguments.
+    """
+    url = make_url(engine_url)
+    backend = url.get_backend_name()
+    driver = url.get_driver_name()
+    engine_kwargs = {"insertmanyvalues_page_size": page_size}
+    if backend == "postgresql" and driver == "psycopg2":
+        engine_kwargs["executemany_mode"] = "values_plus_batch"
+    elif backend == "mssql" and driver == "pyodbc":
+        engine_kwargs["fast_executemany"] = True
+    return engine_kwargs
+
+
+def get_pooling_kwargs(engine_url: str) -> dict:
+    """
+    Function for getting engine keyword arguments for connection pooling.
+    SQLite engines share a single connection across threads, other engines use a bounded connection pool.
+    :param engine_url: URL to create engine for.
+    :return: Engine keyword arguments.
+    """
+    if make_url(engine_url).get_backend_name() == "sqlite":
+        return {"poolclass": StaticPool, "connect_args": {"check_same_thread": False}}
+    else:
+        return {"pool_size": 8, "max_overflow": 16, "pool_pre_ping": True, "pool_recycle": 1800}
+
+
+def set_sqlite_pragmas(engine: Engine, pragmas: dict) -> None:
+    """
+    Function for setting SQLite pragmas on every new connection of an engine.
+    :param engine: Database engine.
+    :param pragmas: Pragma dictionary, mapping pragma names to values.
+    """
+    @event.listens_for(engine, "connect")
+    def set_pragmas(dbapi_connection: Any, connection_record: Any) -> None:
+        cursor = dbapi_connection.cursor()
+        for pragma in pragmas:
+            cursor.execute(f"PRAGMA {pragma}={pragmas[pragma]}")
+        cursor.close()
 
 
 def execute_command(engine: Engine, command: str) -> Optional[Any]:
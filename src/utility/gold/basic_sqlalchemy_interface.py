@@ -17,7 +17,7 @@ class BasicSQLAlchemyInterface(object):
     Class, representing a basic SQL Alchemy interface.
     """
 
-    def __init__(self, working_directory: str, database_uri: str, population_function: Any, schema: str = None, logger: Any = None) -> None:
+    def __init__(self, working_directory: str, database_uri: str, population_function: Any, schema: str = None, logger: Any = None, engine_kwargs: dict = None) -> None:
         """
         Initiation method.
         :param working_directory: Working directory.
@@ -27,6 +27,8 @@ class BasicSQLAlchemyInterface(object):
             Defaults to None.
         :param logger: Logger instance. 
             Defaults to None in which case separate logging is disabled.
+        :param engine_kwargs: Additional keyword arguments for engine creation.
+            Defaults to None.
         """
         self._logger = logger
         self.working_directory = working_directory
@@ -34,6 +36,7 @@ class BasicSQLAlchemyInterface(object):
             os.makedirs(self.working_directory)
         self.database_uri = database_uri
         self.population_function = population_function
+        self.engine_kwargs = {} if engine_kwargs is None else engine_kwargs
 
         # Database infrastructure
         self.base = None
@@ -51,7 +54,8 @@ class BasicSQLAlchemyInterface(object):
         if self.logger is not None:
             self._logger.info("Automapping existing structures")
         self.base = sqlalchemy_utility.automap_base()
-        self.engine = sqlalchemy_utility.get_engine(self.database_uri)
+        self.engine = sqlalchemy_utility.get_engine(
+            self.database_uri, **self.engine_kwargs)
 
         self.model = {}
         self.schema = "" if self.schema is None else self.schema
@@ -157,6 +161,17 @@ class BasicSQLAlchemyInterface(object):
             session.refresh(obj)
         return getattr(obj, self.primary_keys[object_type])
 
+    def post_objects(self, object_type: str, object_attributes: List[dict]) -> None:
+        """
+        Method for adding objects in bulk via a single insert statement.
+        :param object_type: Target object type.
+        :param object_attributes: List of object attribute dictionaries.
+        """
+        if object_attributes:
+            with self.engine.begin() as connection:
+                connection.execute(
+                    self.model[object_type].__table__.insert(), object_attributes)
+
     def patch_object(self, object_type: str, object_id: Any, **object_attributes: Optional[Any]) -> Optional[Any]:
         """
         Method for patching an object.
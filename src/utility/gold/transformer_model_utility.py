@@ -6,16 +6,20 @@
 ****************************************************
 """
 import os
+import gc
+import json
 from datasets import load_dataset
-from typing import Any, Optional, List, Union
+from typing import Any, Optional, List, Union, Tuple, Callable
 from abc import ABC, abstractmethod
 from transformers import AutoTokenizer, AutoModel
 from auto_gptq import AutoGPTQForCausalLM, BaseQuantizeConfig
 from transformers import TrainingArguments, Trainer, DataCollatorWithPadding
 import evaluate
+import torch
 import torch.nn.functional as F
 from torch import Tensor
-from langchain.llms import LlamaCpp
+from llama_cpp import Llama
+from threading import Lock
 import pandas as pd
 import numpy as np
 from src.configuration import configuration as cfg
@@ -24,6 +28,108 @@ from src.configuration import configuration as cfg
 """
 MODEL INSTANTIATION: Loader classes
 """
+# Batch sizes, CUDA inputs are padded up to, limiting the number of shapes CUDA graphs are recorded for
+CUDA_GRAPH_BATCH_SIZES = [1, 2, 4, 8, 16]
+# Multiple, CUDA input sequence lengths are padded up to
+CUDA_GRAPH_SEQUENCE_MULTIPLE = 64
+# Shared model instances, mapping loading keys to lists of the loaded instance and the number of its users
+SHARED_MODELS = {}
+SHARED_MODELS_LOCK = Lock()
+
+
+def acquire_shared_model(loading_function: Callable, *loading_args: str) -> Any:
+    """
+    Function for acquiring a model instance, shared by all users with the same loading function and arguments
+    in the same process. The instance is loaded for the first user.
+    :param loading_function: Function for loading the instance.
+    :param loading_args: Hashable loading function arguments.
+    :return: Shared instance.
+    """
+    key = (loading_function.__name__,) + loading_args
+    with SHARED_MODELS_LOCK:
+        if key not in SHARED_MODELS:
+            SHARED_MODELS[key] = [loading_function(*loading_args), 0]
+        SHARED_MODELS[key][1] += 1
+        return SHARED_MODELS[key][0]
+
+
+def release_shared_model(loading_function: Callable, *loading_args: str) -> None:
+    """
+    Function for releasing a shared model instance.
+    The instance is dropped after its last user released it, so that its memory, including VRAM, is freed.
+    :param loading_function: Function, the instance was loaded with.
+    :param loading_args: Hashable loading function arguments.
+    """
+    key = (loading_function.__name__,) + loading_args
+    with SHARED_MODELS_LOCK:
+        if key not in SHARED_MODELS:
+            return
+        SHARED_MODELS[key][1] -= 1
+        if SHARED_MODELS[key][1] > 0:
+            return
+        SHARED_MODELS.pop(key)
+    gc.collect()
+    if torch.cuda.is_available():
+        torch.cuda.empty_cache()
+
+
+def load_hf_model(model_path: str, tokenizer_kwargs: str, model_kwargs: str) -> Tuple[Any, Any, Lock]:
+    """
+    Function for loading local Huggingface tokenizer and model.
+    Models without explicit device map are moved to CUDA, if available.
+    Models are put into evaluation mode. Models on CUDA devices are cast to half precision and compiled, if supported.
+    :param model_path: Model path.
+    :param tokenizer_kwargs: JSON-encoded tokenizer loading keyword arguments.
+    :param model_kwargs: JSON-encoded model loading keyword arguments.
+    :return: Tokenizer, model and lock for serializing access to the model.
+    """
+    tokenizer = AutoTokenizer.from_pretrained(
+        pretrained_model_name_or_path=model_path,
+        local_files_only=True,
+        **json.loads(tokenizer_kwargs)
+    )
+    if tokenizer.pad_token is None and tokenizer.eos_token is not None:
+        tokenizer.pad_token = tokenizer.eos_token
+    model_kwargs = json.loads(model_kwargs)
+    model = AutoModel.from_pretrained(
+        pretrained_model_name_or_path=model_path,
+        local_files_only=True,
+        **model_kwargs
+    )
+    if torch.cuda.is_available() and "device_map" not in model_kwargs:
+        model = model.to(torch.device("cuda"))
+    model = model.eval()
+    if model.device.type == "cuda":
+        model = model.to(
+            dtype=torch.bfloat16 if torch.cuda.is_bf16_supported() else torch.float16)
+        if hasattr(torch, "compile"):
+            model = torch.compile(model, mode="reduce-overhead")
+    return tokenizer, model, Lock()
+
+
+def get_hf_loading_args(model_path: str, model_config: dict) -> Tuple[str, str, str]:
+    """
+    Function for getting the hashable arguments for loading local Huggingface tokenizer and model.
+    :param model_path: Model path.
+    :param model_config: Model configuration.
+    :return: Model path, JSON-encoded tokenizer and model loading keyword arguments.
+    """
+    loader_kwargs = model_config.get("loader_kwargs", {})
+    return (model_path,
+            json.dumps(loader_kwargs.get("tokenizer", {}), sort_keys=True),
+            json.dumps(loader_kwargs.get("model", {}), sort_keys=True))
+
+
+def load_llamacpp_model(model_path: str, loader_kwargs: str) -> Tuple[Llama, Lock]:
+    """
+    Function for loading a llama.cpp model.
+    :param model_path: Model file path.
+    :param loader_kwargs: JSON-encoded model loading keyword arguments.
+    :return: Model and lock for serializing access to the model.
+    """
+    loader_kwargs = json.loads(loader_kwargs)
+    loader_kwargs.setdefault("n_batch", 512)
+    return Llama(model_path=model_path, **loader_kwargs), Lock()
 
 
 class LanguageModel(ABC):
@@ -48,10 +154,17 @@ class LanguageModel(ABC):
         """
         pass
 
+    def unload(self) -> None:
+        """
+        Method for unloading the language model and releasing its resources.
+        """
+        pass
+
 
 class LlamaCppLM(LanguageModel):
     """
     General LM class for LlamaCpp.
+    Instances for the same model file and loader settings share a single llama.cpp model and its context.
     """
 
     def __init__(self, model_path: str, model_config: dict) -> None:
@@ -61,27 +174,45 @@ class LlamaCppLM(LanguageModel):
         :param model_config: Model configuration.
         :param representation: Language model representation.
         """
-        self.llm = LlamaCpp(
-            model_path=os.path.join(
-                cfg.PATHS.TEXTGENERATION_MODEL_PATH, model_path, model_config["model_version"]),
-            **model_config.get("loader_kwargs", {})
-        )
+        self.loading_args = (os.path.join(cfg.PATHS.TEXTGENERATION_MODEL_PATH, model_path, model_config["model_version"]),
+                             json.dumps(model_config.get("loader_kwargs", {}), sort_keys=True))
+        self.llm, self.lock = acquire_shared_model(
+            load_llamacpp_model, *self.loading_args)
+        self.generation_kwargs = {"max_tokens": 256}
+        self.generation_kwargs.update(
+            model_config.get("generation_kwargs", {}))
 
     def generate(self, prompt: Union[str, List[str]]) -> Optional[Any]:
         """
         Main handler method for wrapping language model capabilities.
+        Prompt lists are processed within a single acquisition of the shared model.
         :param prompt: User prompt(s).
         :return: Response(s), if generation was successful.
         """
-        return self.llm.generate(prompt if isinstance(prompt, list) else [prompt])
+        prompts = prompt if isinstance(prompt, list) else [prompt]
+        with self.lock:
+            responses = [self.llm.create_completion(single_prompt, **self.generation_kwargs)["choices"][0]["text"]
+                         for single_prompt in prompts]
+        return responses if isinstance(prompt, list) else responses[0]
 
     def get_model_instance(self) -> Any:
         """
         Method for getting model instance.
+        Note, that the raw llama.cpp model is returned instead of a LangChain LLM.
+        The model is shared with other instances, so access to it needs to be serialized via the instance lock.
         :return: LLM instance.
         """
         return self.llm
 
+    def unload(self) -> None:
+        """
+        Method for unloading the language model and releasing its resources.
+        The shared model is dropped after its last instance was unloaded.
+        """
+        if self.llm is not None:
+            self.llm, self.lock = None, None
+            release_shared_model(load_llamacpp_model, *self.loading_args)
+
 
 class AutoGPTQLM(LanguageModel):
     """
@@ -144,6 +275,8 @@ class AutoGPTQLM(LanguageModel):
 class LocalHFLM(LanguageModel):
     """
     General LM class for local Huggingface models.
+    Instances for the same model and loader settings share a single model, which is used by one instance at a time,
+    as the CUDA graphs of compiled models can not be replayed concurrently.
     """
 
     def __init__(self, model_path: str, model_config: dict) -> None:
@@ -152,32 +285,83 @@ class LocalHFLM(LanguageModel):
         :param model_path: Relative model path.
         :param model_config: Model configuration.
         """
-        self.tokenizer = AutoTokenizer.from_pretrained(
-            pretrained_model_name_or_path=model_path,
-            local_files_only=True,
-            **model_config.get("loader_kwargs", {}).get("tokenizer", {})
-        )
-        self.model = AutoModel.from_pretrained(
-            pretrained_model_name_or_path=model_path,
-            local_files_only=True,
-            **model_config.get("loader_kwargs", {}).get("model", {})
-        )
+        self.loading_args = get_hf_loading_args(model_path, model_config)
+        self.tokenizer, self.model, self.lock = acquire_shared_model(
+            load_hf_model, *self.loading_args)
 
+    @torch.inference_mode()
     def generate(self, prompt: Union[str, List[str]]) -> Optional[Any]:
         """
         Main embedding method.
+        Prompt lists are tokenized with padding and processed in a single batched forward pass.
         :param prompt: User prompt(s).
         :return: Response(s), if generation was successful.
+            For prompt lists, the batched output is split into one model output per prompt.
+            Split outputs keep a batch dimension of one and include the padded positions.
         """
-        if isinstance(prompt, list):
-            responses = []
-            for single_prompt in prompt:
-                inputs = self.tokenizer(single_prompt, return_tensors="pt")
-                responses.append(self.model(**inputs))
-            return responses
+        prompts = prompt if isinstance(prompt, list) else [prompt]
+        with self.lock:
+            responses = self.split_outputs(
+                self.forward(self.tokenize(prompts)), len(prompts))
+        return responses if isinstance(prompt, list) else responses[0]
+
+    def forward(self, inputs: Any) -> Any:
+        """
+        Method for running a forward pass of the model.
+        Compiled models on CUDA devices replay CUDA graphs, so a new step is marked before every invocation.
+        :param inputs: Model inputs.
+        :return: Model outputs. Outputs of CUDA graphs are overwritten by the next replay and need to be copied.
+        """
+        if self.model.device.type == "cuda" and hasattr(torch, "compiler") and hasattr(torch.compiler, "cudagraph_mark_step_begin"):
+            torch.compiler.cudagraph_mark_step_begin()
+        return self.model(**inputs)
+
+    def split_outputs(self, outputs: Any, prompt_count: int) -> List[Any]:
+        """
+        Method for splitting batched model outputs into model outputs per prompt.
+        Split tensors are copied, so that they are not overwritten by later replays of CUDA graphs.
+        :param outputs: Batched model outputs.
+        :param prompt_count: Number of prompts, additional padding entries of the batch are dropped.
+        :return: List of model outputs.
+        """
+        def select(value: Any, index: int) -> Any:
+            if isinstance(value, Tensor):
+                return value[index:index+1].clone()
+            elif isinstance(value, tuple):
+                return tuple(select(entry, index) for entry in value)
+            else:
+                return value
+
+        return [outputs.__class__(**{key: select(outputs[key], index) for key in outputs.keys()})
+                for index in range(prompt_count)]
+
+    def unload(self) -> None:
+        """
+        Method for unloading the language model and releasing its resources.
+        The shared model is dropped after its last instance was unloaded.
+        """
+        if self.model is not None:
+            self.tokenizer, self.model, self.lock = None, None, None
+            release_shared_model(load_hf_model, *self.loading_args)
+
+    def tokenize(self, prompts: List[str]) -> Any:
+        """
+        Method for tokenizing a batch of prompts.
+        :param prompts: User prompts.
+        :return: Padded and truncated model inputs, placed on the model device.
+            Inputs for CUDA devices are padded to bucketed shapes, so that the CUDA graphs, recorded by the compiled
+            model, can be replayed. Those inputs might contain additional empty prompts and are copied
+            asynchronously from pinned memory.
+        """
+        if self.model.device.type == "cuda":
+            batch_size = next((size for size in CUDA_GRAPH_BATCH_SIZES if size >= len(prompts)), len(prompts))
+            inputs = self.tokenizer(prompts + [""] * (batch_size - len(prompts)), max_length=512, padding="longest",
+                                    truncation=True, pad_to_multiple_of=CUDA_GRAPH_SEQUENCE_MULTIPLE,
+                                    return_attention_mask=True, return_tensors="pt")
+            return {key: inputs[key].pin_memory().to(self.model.device, non_blocking=True) for key in inputs}
         else:
-            inputs = self.tokenizer(prompt, return_tensors="pt")
-            return self.model(**inputs)
+            return self.tokenizer(prompts, max_length=512, padding="longest", truncation=True,
+                                  return_attention_mask=True, return_tensors="pt")
 
     def get_model_instance(self) -> Any:
         """
@@ -192,45 +376,31 @@ class LocalHFEmbeddingLM(LocalHFLM):
     General LM class for local Huggingface models for embedding.
     """
 
-    def generate(self, prompt: Union[str, List[str]]) -> Optional[Any]:
+    @torch.inference_mode()
+    def generate(self, prompt: Union[str, List[str]]) -> Optional[np.ndarray]:
         """
         Main embedding method.
         :param prompt: User prompt(s).
-        :return: Response(s), if generation was successful.
+        :return: Normalized embedding array with one row per prompt, if generation was successful.
         """
-        if isinstance(prompt, list):
-            responses = []
-            for single_prompt in prompt:
-                inputs = self.tokenizer(prompt, max_length=512,
-                                        padding=True, truncation=True, return_tensors='pt')
-
-                outputs = self.model(**inputs)
-                embeddings = self.average_pool(outputs.last_hidden_state,
-                                               inputs['attention_mask'])
-
-                # normalize embeddings
-                embeddings = F.normalize(embeddings, p=2, dim=1)
-                responses.append(embeddings.tolist())
-            return responses
-        else:
-            inputs = self.tokenizer(prompt, max_length=512,
-                                    padding=True, truncation=True, return_tensors='pt')
-
-            outputs = self.model(**inputs)
+        with self.lock:
+            inputs = self.tokenize(
+                prompt if isinstance(prompt, list) else [prompt])
+            outputs = self.forward(inputs)
             embeddings = self.average_pool(outputs.last_hidden_state,
                                            inputs['attention_mask'])
 
             # normalize embeddings
-            embeddings = F.normalize(embeddings, p=2, dim=1)
-            return embeddings.tolist()
+            embeddings = F.normalize(embeddings.float(), p=2, dim=1)
+            return embeddings[:len(prompt) if isinstance(prompt, list) else 1].cpu().numpy()
 
     def average_pool(self, last_hidden_states: Tensor, attention_mask: Tensor) -> Tensor:
         """
-        Average pooling function, taken from https://huggingface.co/intfloat/e5-large-v2.
+        Average pooling function, adapted from https://huggingface.co/intfloat/e5-large-v2.
+        Masked summation is fused into a single einsum, avoiding a masked copy of the hidden states.
         """
-        last_hidden = last_hidden_states.masked_fill(
-            ~attention_mask[..., None].bool(), 0.0)
-        return last_hidden.sum(dim=1) / attention_mask.sum(dim=1)[..., None]
+        mask = attention_mask.to(last_hidden_states.dtype)
+        return torch.einsum("bld,bl->bd", last_hidden_states, mask) / mask.sum(dim=1, keepdim=True).clamp(min=1)
 
     def get_model_instance(self) -> Any:
         """
@@ -342,6 +512,10 @@ SUPPORTED_TYPES = {
     }
 
 }
+# Flat lookup dictionary, mapping type and loader tuples to available loader classes
+SUPPORTED_LOADERS = {(model_type, loader): SUPPORTED_TYPES[model_type]["loaders"][loader]
+                     for model_type in SUPPORTED_TYPES for loader in SUPPORTED_TYPES[model_type]["loaders"]
+                     if SUPPORTED_TYPES[model_type]["loaders"][loader] is not None}
 
 
 def spawn_language_model_instance(model_path: str, model_config: dict) -> Optional[LanguageModel]:
@@ -351,8 +525,8 @@ def spawn_language_model_instance(model_path: str, model_config: dict) -> Option
         :param model_config: Model configuration.
     :return: Language model instance if configuration was successful else None.
     """
-    lm = SUPPORTED_TYPES.get(model_config.get("type"), {}).get(
-        "loaders", {}).get(model_config.get("loader", "_default"))
+    lm = SUPPORTED_LOADERS.get(
+        (model_config.get("type"), model_config.get("loader", "_default")))
     if lm is not None:
         lm = lm(model_path, model_config)
     return lm